@@ -1,22 +1,101 @@
 """Evaluation endpoint for text assessment."""
 
 from fastapi import APIRouter, Body, Depends, HTTPException
-from openai import AsyncOpenAI
 from datetime import datetime
-from typing import Dict, Any
-from loguru import logger
-import traceback
+from typing import Dict, Any, List
+import asyncio
+import time
 
 from models.schemas import EvaluationRequest, EvaluationResponse, EvaluationResult
-from core.dependencies import get_engine_instance
+from core.dependencies import get_engine_instance, get_llm_semaphore, get_openai_client_instance
+from core.evaluation import hash_text
 from core.config import settings
 
 router = APIRouter(prefix="/evaluate", tags=["evaluation"])
 
+# Upper bound for /evaluate/batch items per request
+MAX_BATCH_SIZE = 64
 
-def get_openai_client() -> AsyncOpenAI:
-    """Get OpenAI client."""
-    return AsyncOpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
+
+async def _perform_evaluation(payload: EvaluationRequest) -> EvaluationResponse:
+    """Run one evaluation request against the shared engine and client.
+
+    Shared by the single and batch endpoints; raises HTTPException(400)
+    for unknown scheme IDs.
+    """
+    # Use singleton engine instance (initialized at app startup)
+    engine = get_engine_instance()
+    # Shared client: reuses pooled HTTP connections across requests
+    openai_client = get_openai_client_instance()
+    # Scan the text once up front; length and hash are reused downstream
+    text = payload.text
+    text_len = len(text)
+    text_hash = hash_text(text)
+
+    # Validate schemes exist (preserves request order in the error detail)
+    invalid_schemes = [s for s in payload.schemes if s not in engine.scheme_ids]
+    if invalid_schemes:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown schemes: {invalid_schemes}"
+        )
+
+    # Perform evaluation (monotonic ns counter for timing, wall clock
+    # only for the provenance timestamp)
+    timestamp = datetime.now().isoformat()
+    start_ns = time.perf_counter_ns()
+    evaluation_data = await engine.evaluate_text(
+        text=text,
+        scheme_ids=payload.schemes,
+        llm_client=openai_client,
+        model=settings.openai_model,
+        context_type=payload.context_type,
+        semaphore=get_llm_semaphore(),
+        text_hash=text_hash
+    )
+    processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+    # Convert to response format. The engine output is trusted, so use
+    # model_construct (Pydantic v2 fast path) and skip re-validation;
+    # the include_reasoning branch is decided once, not per result.
+    include_reasoning = payload.include_reasoning
+    results = [
+        EvaluationResult.model_construct(
+            scheme_id=result["scheme_id"],
+            dimension=result["dimension"],
+            value=result.get("value"),
+            label=result.get("label"),
+            confidence=result.get("confidence"),
+            reasoning=result.get("reasoning") if include_reasoning else None,
+            criteria=result.get("criteria") if include_reasoning else None,
+            scale_info=result.get("scale_info"),
+            na_reason=result.get("na_reason")
+        )
+        for result in evaluation_data["results"]
+    ]
+
+    # Build metadata and provenance
+    metadata = {
+        "processing_time_ms": processing_time_ms,
+        "model_used": settings.openai_model,
+        "include_reasoning": payload.include_reasoning
+    }
+
+    provenance = {
+        "timestamp": timestamp,
+        "api_version": "0.1.0",
+        "text_length": text_len,
+        "schemes_count": len(payload.schemes)
+    }
+
+    return EvaluationResponse(
+        results=results,
+        gates_passed=evaluation_data.get("gates_passed", True),
+        overall_score=evaluation_data.get("overall_score"),
+        overall_label=evaluation_data.get("overall_label"),
+        metadata=metadata,
+        provenance=provenance
+    )
 
 
 @router.post("/", response_model=EvaluationResponse,
@@ -86,78 +165,87 @@ async def evaluate_text(payload: EvaluationRequest = Body(...)) -> EvaluationRes
     - Derived compliance: 0 (non-compliant) or 1 (compliant)
     """
     try:
-        # Use singleton engine instance (initialized at app startup)
-        engine = get_engine_instance()
-        openai_client = AsyncOpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
-        # Validate schemes exist
-        available_schemes = {s["id"] for s in engine.get_schemes()}
-        invalid_schemes = set(payload.schemes) - available_schemes
-        if invalid_schemes:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Unknown schemes: {list(invalid_schemes)}"
-            )
-        
-        # Perform evaluation
-        start_time = datetime.now()
-        evaluation_data = await engine.evaluate_text(
-            text=payload.text,
-            scheme_ids=payload.schemes,
-            llm_client=openai_client,
-            model=settings.openai_model,
-            context_type=payload.context_type
-        )
-        end_time = datetime.now()
-        
-        # Convert to response format
-        results = [
-            EvaluationResult(
-                scheme_id=result["scheme_id"],
-                dimension=result["dimension"],
-                value=result.get("value"),
-                label=result.get("label"),
-                confidence=result.get("confidence"),
-                reasoning=result.get("reasoning") if payload.include_reasoning else None,
-                criteria=result.get("criteria") if payload.include_reasoning else None,
-                scale_info=result.get("scale_info"),
-                na_reason=result.get("na_reason")
-            )
-            for result in evaluation_data["results"]
-        ]
-        
-        # Build metadata and provenance
-        metadata = {
-            "processing_time_ms": int((end_time - start_time).total_seconds() * 1000),
-            "model_used": settings.openai_model,
-            "include_reasoning": payload.include_reasoning
-        }
-        
-        provenance = {
-            "timestamp": start_time.isoformat(),
-            "api_version": "0.1.0",
-            "text_length": len(payload.text),
-            "schemes_count": len(payload.schemes)
-        }
-        
-        return EvaluationResponse(
-            results=results,
-            gates_passed=evaluation_data.get("gates_passed", True),
-            overall_score=evaluation_data.get("overall_score"),
-            overall_label=evaluation_data.get("overall_label"),
-            metadata=metadata,
-            provenance=provenance
-        )
-        
+        return await _perform_evaluation(payload)
+
     except HTTPException:
         # Re-raise HTTP exceptions (like 400 for invalid schemes)
         raise
     except Exception as e:
+        # Imported lazily: only the error path pays for these modules
+        import traceback
+        from loguru import logger
+
         # Log detailed error internally
         logger.error(f"Evaluation failed with exception: {str(e)}")
         logger.error(f"Stacktrace: {traceback.format_exc()}")
-        
+
         # Return generic error to client (avoid info leakage)
         raise HTTPException(
-            status_code=500, 
+            status_code=500,
+            detail="Evaluation failed due to an internal error. Please check your request or contact support."
+        )
+
+
+@router.post("/batch", response_model=List[EvaluationResponse],
+         summary="Evaluate Multiple Texts")
+async def evaluate_batch(payload: List[EvaluationRequest] = Body(...)) -> List[EvaluationResponse]:
+    """Evaluate multiple texts in one request.
+
+    Accepts a list of up to 64 evaluation requests (same shape as
+    ``POST /evaluate/``) and processes them concurrently on the server,
+    sharing the singleton engine, the pooled OpenAI client, the result
+    cache, and the global LLM concurrency limit. For bulk workflows this
+    removes the per-document HTTP round-trip without oversubscribing the
+    upstream API.
+
+    **Notes:**
+
+    - Items are evaluated in parallel; the response list matches the
+      request order.
+    - If any item references an unknown scheme, the whole batch fails
+      with a 400 (validate via ``GET /schemes/`` first).
+    """
+    if not payload:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one request")
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch size {len(payload)} exceeds maximum of {MAX_BATCH_SIZE}"
+        )
+
+    # Validate every item's schemes before launching any evaluation: a bad
+    # scheme id 400s the whole batch, so no sibling should spend LLM calls
+    # on a response that is already an error (cheap synchronous set check)
+    scheme_ids = get_engine_instance().scheme_ids
+    invalid_schemes = [s for req in payload for s in req.schemes if s not in scheme_ids]
+    if invalid_schemes:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown schemes: {invalid_schemes}"
+        )
+
+    tasks = [asyncio.create_task(_perform_evaluation(req)) for req in payload]
+    try:
+        return list(await asyncio.gather(*tasks))
+
+    except Exception as e:
+        # First failure cancels the remaining items (gather leaves them
+        # running detached) and reaps them so no task exception goes
+        # unretrieved
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if isinstance(e, HTTPException):
+            raise
+        # Imported lazily: only the error path pays for these modules
+        import traceback
+        from loguru import logger
+
+        logger.error(f"Batch evaluation failed with exception: {str(e)}")
+        logger.error(f"Stacktrace: {traceback.format_exc()}")
+
+        raise HTTPException(
+            status_code=500,
             detail="Evaluation failed due to an internal error. Please check your request or contact support."
         )
@@ -1,8 +1,6 @@
 """Health check endpoint."""
 
 from fastapi import APIRouter
-from loguru import logger
-import traceback
 
 from models.schemas import HealthResponse
 
@@ -31,20 +29,21 @@ async def health_check() -> HealthResponse:
     }
     ```
     """
-    from core.dependencies import get_engine_instance
-    
+    from core.dependencies import get_schemes_count
+
     try:
-        # Use singleton engine instance (initialized at app startup)
-        engine = get_engine_instance()
-        schemes = engine.get_schemes()
-        schemes_count = len(schemes)
-        
+        # Constant-time: the count is snapshotted at engine initialization,
+        # so frequent liveness probes never walk the scheme list
         return HealthResponse(
             status="healthy",
             version="0.1.0",
-            schemes_loaded=schemes_count
+            schemes_loaded=get_schemes_count()
         )
     except Exception as e:
+        # Imported lazily: only the error path pays for these modules
+        import traceback
+        from loguru import logger
+
         # Log error internally
         logger.error(f"Health check failed: {str(e)}")
         logger.error(f"Stacktrace: {traceback.format_exc()}")
@@ -2,8 +2,6 @@
 
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict, Any
-from loguru import logger
-import traceback
 
 from core.dependencies import get_engine_instance
 from models.schemas import SchemesResponse
@@ -86,25 +84,15 @@ async def list_schemes(
     try:
         # Use singleton engine instance (initialized at app startup)
         engine = get_engine_instance()
-        schemes_data = engine.get_schemes()
-        
-        # Filter out part schemas unless explicitly requested
-        if not include_parts:
-            schemes_data = [
-                scheme for scheme in schemes_data
-                if "_part" not in scheme.get("id", "")
-            ]
-        
-        # Simple response without complex Pydantic models
-        response = {
-            "schemes": schemes_data,
-            "total": len(schemes_data),
-            "status": "success"
-        }
-        
-        return response
+
+        # Payloads (with and without part schemas) are pre-built at load time
+        return engine.get_schemes_response(include_parts)
         
     except Exception as e:
+        # Imported lazily: only the error path pays for these modules
+        import traceback
+        from loguru import logger
+
         # Log detailed error internally
         logger.error(f"Failed to load schemes: {str(e)}")
         logger.error(f"Error type: {type(e).__name__}")
@@ -0,0 +1,46 @@
+"""Request coalescing for concurrent identical LLM evaluations."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from loguru import logger
+
+
+class SingleFlightCoalescer:
+    """Share one in-flight computation among concurrent identical requests.
+
+    Under load, multiple users often submit the same text against
+    overlapping scheme sets. When several callers request the same key
+    concurrently, only the first actually runs the coroutine factory; the
+    others await the same task and receive the identical result, so
+    duplicated traffic costs a single LLM call instead of N.
+
+    Entries are removed as soon as the computation finishes - this only
+    deduplicates overlapping in-flight work; caching of completed results
+    is a separate concern.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory() for key, sharing the result with concurrent callers.
+
+        Args:
+            key: Hashable identity of the computation, e.g.
+                 (scheme_id, text_hash, model, context_type)
+            factory: Zero-argument callable returning the coroutine to run
+
+        Returns:
+            The result of the (possibly shared) computation.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        else:
+            logger.debug(f"Coalescing duplicate in-flight evaluation: {key[0]}")
+
+        # Shield so one cancelled caller does not kill the shared task
+        return await asyncio.shield(task)
@@ -1,5 +1,7 @@
 """Configuration settings."""
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -12,8 +14,19 @@ class Settings(BaseSettings):
     openai_base_url: str = Field("https://api.openai.com/v1", env="OPENAI_BASE_URL")
     log_level: str = Field("INFO", env="LOG_LEVEL")
     schemes_dir: str = Field("schemes", env="SCHEMES_DIR")
-    
-    model_config = {"env_file": ".env", "extra": "ignore"}
+
+    model_config = {"env_file": ".env", "extra": "ignore", "frozen": True}
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached Settings instance.
+
+    Guarantees .env is parsed and validated exactly once, even when
+    construction is triggered again (tests, hot reload, serverless
+    cold-start fallback paths).
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
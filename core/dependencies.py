@@ -1,12 +1,35 @@
 """FastAPI dependencies for singleton instances."""
 
+import asyncio
+import os
 from typing import Optional
 
+from loguru import logger
+from openai import AsyncOpenAI
+
 from core.config import settings
 from core.evaluation import EvaluationEngine
 
-# Global singleton instance
+# Global singleton instances
 _engine_instance: Optional[EvaluationEngine] = None
+_openai_client: Optional[AsyncOpenAI] = None
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+_schemes_count: int = 0
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the process-wide semaphore bounding in-flight OpenAI calls.
+
+    Without this bound, concurrent /evaluate bursts can pile up unbounded
+    requests in the shared client, triggering 429s or pool exhaustion.
+    Created lazily so it binds to the running event loop.
+    """
+    global _llm_semaphore
+
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_INFLIGHT", "64")))
+
+    return _llm_semaphore
 
 
 def get_engine_instance() -> EvaluationEngine:
@@ -21,23 +44,97 @@ def get_engine_instance() -> EvaluationEngine:
     return _engine_instance
 
 
+def get_openai_client_instance() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it if necessary.
+
+    A single client instance is reused for the process lifetime so the
+    underlying HTTP connection pool (and its TLS/TCP handshakes) is shared
+    across all requests instead of being rebuilt per call.
+    """
+    global _openai_client
+
+    if _openai_client is None:
+        # Fallback for environments where FastAPI startup hooks (lifespan)
+        # are not triggered (e.g. some serverless cold starts).
+        _openai_client = _create_openai_client()
+
+    return _openai_client
+
+
+def _create_openai_client() -> AsyncOpenAI:
+    """Construct the AsyncOpenAI client from application settings.
+
+    Uses the SDK's aiohttp transport, which holds up much better than the
+    default httpx transport beyond ~20 concurrent in-flight requests.
+    Falls back to the default transport if aiohttp is not installed.
+
+    The default pool (100 connections, 20 keep-alive) is too small for the
+    fan-out of concurrent /evaluate requests, so the limits are raised and
+    keep-alive extended; long-lived connections avoid TLS/TCP re-setup to
+    the OpenAI/base_url endpoint. (HTTP/2 multiplexing is not available on
+    the aiohttp transport.)
+    """
+    try:
+        # Imported here so SDKs predating the aiohttp transport (and
+        # environments without it) fall through to the default client
+        # instead of failing at module import
+        import httpx2
+        from openai import DefaultAioHttpClient
+
+        http_client = DefaultAioHttpClient(
+            limits=httpx2.Limits(
+                max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "256")),
+                max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE", "128")),
+                keepalive_expiry=60.0,
+            ),
+        )
+    except Exception as e:
+        logger.warning(f"aiohttp transport unavailable, using default httpx client: {e}")
+        http_client = None
+
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url,
+        http_client=http_client,
+    )
+
+
 def initialize_engine(schemes_dir: str = "schemes") -> None:
-    """Initialize the singleton EvaluationEngine instance.
-    
+    """Initialize the singleton EvaluationEngine and OpenAI client instances.
+
     This should be called once during application startup.
-    
+
     Args:
         schemes_dir: Directory containing YAML scheme files
     """
-    global _engine_instance
+    global _engine_instance, _openai_client, _schemes_count
     if _engine_instance is None:
         _engine_instance = EvaluationEngine(schemes_dir)
+        _schemes_count = len(_engine_instance.schemes)
+    if _openai_client is None:
+        _openai_client = _create_openai_client()
+
+
+def get_schemes_count() -> int:
+    """Return the number of loaded schemes without touching the engine.
+
+    Snapshotted at initialization so liveness probes (which can fire every
+    second) stay constant-time instead of materializing the scheme list.
+    """
+    if _engine_instance is None:
+        # Triggers the cold-start fallback and populates the count
+        get_engine_instance()
+    return _schemes_count
 
 
-def shutdown_engine() -> None:
-    """Cleanup the singleton EvaluationEngine instance.
-    
+async def shutdown_engine() -> None:
+    """Cleanup the singleton EvaluationEngine and OpenAI client instances.
+
     This should be called during application shutdown.
     """
-    global _engine_instance
+    global _engine_instance, _openai_client, _schemes_count
     _engine_instance = None
+    _schemes_count = 0
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
@@ -1,12 +1,28 @@
 """Core evaluation engine supporting multiple scale types."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import partial
+from cachetools import TTLCache
 from loguru import logger
+import orjson
 import yaml
+try:
+    # libyaml-backed loader is ~5-10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 import asyncio
+import bisect
+import hashlib
+import math
+import operator
 import os
+import re
+import sqlite3
+import time
 from pathlib import Path
 
+from core.batcher import SingleFlightCoalescer
 from models.schemas import (
     AggregationStrategy,
     MissingStrategy,
@@ -15,6 +31,67 @@ from models.schemas import (
 )
 
 
+def hash_text(text: str) -> str:
+    """Return the blake2b hex digest identifying a text for caching."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Known tags of the structured "TAG: value" response format. One pass of the
+# C regex engine replaces per-line startswith scans in the parsers.
+_TAG_RE = re.compile(r'^\s*(RESULT|SCORE|LABEL|REASONING|ASPEKT_\d+)\s*:\s*(.*)$', re.MULTILINE)
+
+# Standalone checklist level digit, for the contextual fallback parse
+_LEVEL_RE = re.compile(r'\b([1-4])\b')
+
+# Word-bounded yes/no tokens for the sentiment fallback; substring counting
+# would also match inside words ("no" in "noch", "ja" in "Jahr")
+_YESNO_RE = re.compile(r'\b(yes|ja|no|nein)\b')
+
+# Begründung section of a gate's enhanced reasoning (runs to the next blank
+# line or end of text), plus markdown-bold cleanup for the excerpt
+_BEGRUENDUNG_RE = re.compile(r'\*\*Begründung:\*\*\s*(.+?)(?:\n\s*\n|\Z)', re.DOTALL)
+_MD_BOLD_RE = re.compile(r'\*\*')
+
+# Non-numeric checklist answers mapped to the item's level bounds; a single
+# dict.get replaces the per-call membership chains over fresh list literals
+_YES_NO_MAP = {
+    'JA': 'max', 'YES': 'max', 'TRUE': 'max',
+    'NEIN': 'min', 'NO': 'min', 'FALSE': 'min',
+}
+
+# Dependency-result fields worth echoing in error logs
+_DEP_LOG_FIELDS = ('scheme_id', 'dimension', 'value', 'label')
+
+# Comparison operators allowed in derivation rule conditions
+_CONDITION_OPS = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt,
+    '==': operator.eq,
+}
+
+
+# Output caps per scale type: the responses are structured and short, so
+# bounding completion tokens trims cost and tail latency without truncating
+# real content. Gates emit one justified line per aspect, and the largest
+# shipped gates carry 20+ rules, so their cap scales with the rule count —
+# a flat cap would silently drop trailing ASPEKT lines, which parse as
+# passed and would turn truncation into a false PASS.
+_GATE_BASE_TOKENS = 256
+_GATE_TOKENS_PER_ASPECT = 64
+_RUBRIC_MAX_TOKENS = 256
+_CHECKLIST_MAX_TOKENS = 1024
+
+
+def _parse_tagged_response(content: str) -> Dict[str, str]:
+    """Map TAG -> value for a structured LLM response (first match wins)."""
+    parsed: Dict[str, str] = {}
+    for match in _TAG_RE.finditer(content):
+        parsed.setdefault(match.group(1).upper(), match.group(2).strip())
+    return parsed
+
+
 class EvaluationEngine:
     """Core engine for text evaluation using various scale types."""
     
@@ -23,29 +100,125 @@ class EvaluationEngine:
         self.schemes: Dict[str, Dict[str, Any]] = {}
         self.max_concurrent_llm_calls = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", "20"))
         logger.info(f"Concurrency limit: {self.max_concurrent_llm_calls} parallel LLM calls")
+        # Engine-wide fallback semaphore for callers that pass none; created
+        # lazily in _get_sem so it binds to the running event loop
+        self._llm_sem: Optional[asyncio.Semaphore] = None
+        self._coalescer = SingleFlightCoalescer()
+        # Cross-request result cache: repeat evaluations of unchanged content
+        # (common during authoring/review cycles) become dict lookups instead
+        # of LLM round-trips
+        self._result_cache: TTLCache = TTLCache(
+            maxsize=int(os.getenv("EVAL_CACHE_SIZE", "10000")),
+            ttl=int(os.getenv("EVAL_CACHE_TTL", "3600")),
+        )
+        # Completion-level cache keyed by the exact request payload; catches
+        # duplicate prompts that the per-scheme cache misses (e.g. the same
+        # dependency evaluated under different derived schemes)
+        self._completion_cache: TTLCache = TTLCache(
+            maxsize=int(os.getenv("LLM_CACHE_SIZE", "10000")),
+            ttl=int(os.getenv("EVAL_CACHE_TTL", "3600")),
+        )
+        # Optional durable tier below the in-memory completion cache, so
+        # duplicate evaluations keep hitting across restarts/deploys.
+        # Opt-in via LLM_CACHE_PATH; serverless filesystems are ephemeral
+        # or read-only, so it stays off by default.
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        disk_cache_path = os.getenv("LLM_CACHE_PATH", "")
+        if disk_cache_path:
+            try:
+                self._disk_cache = sqlite3.connect(disk_cache_path)
+                # WAL keeps point reads fast while writes land
+                self._disk_cache.execute("PRAGMA journal_mode=WAL")
+                self._disk_cache.execute(
+                    "CREATE TABLE IF NOT EXISTS completions ("
+                    "key BLOB PRIMARY KEY, value TEXT NOT NULL, created_at INTEGER NOT NULL)"
+                )
+                self._disk_cache.commit()
+                logger.info(f"Durable completion cache enabled at {disk_cache_path}")
+            except Exception as e:
+                logger.warning(f"Could not open completion cache {disk_cache_path}: {e}")
+                self._disk_cache = None
+        # Compiled prompt fragments: everything except the evaluated text is
+        # static per scheme (per scheme and context type for gates), so the
+        # anchors/rules/items blocks are formatted once and the hot path only
+        # splices the text between two cached strings
+        self._gate_prompt_parts: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._rubric_prompt_parts: Dict[str, Tuple[str, str]] = {}
+        self._checklist_prompt_parts: Dict[str, Tuple[str, str]] = {}
+        # Per-scheme anchor lookups: label-by-value dict plus the static
+        # scale_info levels list, built on first use
+        self._anchor_info: Dict[str, Tuple[Dict[Any, str], List[str]]] = {}
+        # Per-scheme checklist item index (level->score map, level bounds,
+        # na score per item), built on first use
+        self._checklist_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Per-scheme label thresholds, parsed to float and sorted ascending
+        # as parallel (thresholds, labels) tuples for bisection
+        self._labels_sorted: Dict[str, Tuple[Tuple[float, ...], Tuple[str, ...]]] = {}
+        # Per-scheme anchors prepared for substring matching
+        # (value string, lowered label, anchor)
+        self._anchors_prepared: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {}
+        # Per-scheme gate rules with their aspect/tag keys preformatted
+        # (criteria key, response tag, rule)
+        self._gate_rules_prepared: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {}
+        # Dispatch table for the LLM-backed scale types; derived schemes are
+        # handled separately since they carry the request-scoped cache
+        self._scale_handlers = {
+            ScaleType.ORDINAL_RUBRIC: self._evaluate_ordinal_rubric,
+            ScaleType.CHECKLIST_ADDITIVE: self._evaluate_checklist_additive,
+        }
         self._load_schemes()
-    
+
     def _load_schemes(self) -> None:
-        """Load all YAML schemes from directory."""
+        """Load all YAML schemes from directory.
+
+        YAML parsing is an order of magnitude slower than JSON, so schemes
+        are compiled into a JSON blob on first load and reloaded from it on
+        subsequent startups as long as no YAML source changed. This keeps
+        the serverless cold-start fallback in get_engine_instance cheap.
+        """
+        # A missing directory only skips the file loading; the derived
+        # structures below are still built (empty) so the endpoints degrade
+        # to "no schemes" instead of hitting unset attributes
         if not self.schemes_dir.exists():
             logger.warning(f"Schemes directory {self.schemes_dir} not found")
-            return
-        
-        for yaml_file in self.schemes_dir.glob("*.yaml"):
+        else:
+            yaml_files = sorted(self.schemes_dir.glob("*.yaml"))
+
+            compiled = self._load_compiled_schemes(yaml_files)
+            if compiled is not None:
+                self.schemes = compiled
+            else:
+                for yaml_file in yaml_files:
+                    try:
+                        with open(yaml_file, 'r', encoding='utf-8') as f:
+                            scheme = yaml.load(f, Loader=_YamlLoader)
+                            self.schemes[scheme['id']] = scheme
+                            logger.debug(f"Loaded scheme: {scheme['id']}")
+                    except Exception as e:
+                        logger.error(f"Failed to load scheme {yaml_file}: {e}")
+                self._write_compiled_schemes(yaml_files)
+            logger.info(
+                f"Loaded {len(self.schemes)} schemes from {self.schemes_dir.resolve()}"
+            )
+        # Immutable ID set for O(1) membership checks on the request hot path
+        self._scheme_ids: frozenset = frozenset(self.schemes)
+
+        # Scheme types are static after load, so the enum coercion (and its
+        # try/except) runs once here; schemes with an unknown type are
+        # flagged at startup instead of warning on every request
+        self._scale_types: Dict[str, ScaleType] = {}
+        for scheme_id, scheme in self.schemes.items():
             try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    scheme = yaml.safe_load(f)
-                    self.schemes[scheme['id']] = scheme
-                    logger.debug(f"Loaded scheme: {scheme['id']}")
-            except Exception as e:
-                logger.error(f"Failed to load scheme {yaml_file}: {e}")
-        logger.info(
-            f"Loaded {len(self.schemes)} schemes from {self.schemes_dir.resolve()}"
-        )
-    
-    def get_schemes(self) -> List[Dict[str, Any]]:
-        """Get list of available schemes."""
-        return [
+                self._scale_types[scheme_id] = ScaleType(scheme["type"])
+            except (KeyError, ValueError):
+                logger.warning(
+                    f"Unknown scheme type for {scheme_id}: {scheme.get('type')}"
+                )
+
+        # Scheme data is static after load, so the summary list and the
+        # /schemes payloads (with and without part schemas) are built once
+        # instead of per request
+        self._schemes_summary: List[Dict[str, Any]] = [
             {
                 "id": scheme["id"],
                 "name": scheme["name"],
@@ -57,35 +230,267 @@ class EvaluationEngine:
             }
             for scheme in self.schemes.values()
         ]
-    
-    async def _run_with_concurrency_limit(
-        self,
-        tasks: List[asyncio.Task],
-        semaphore: Optional[asyncio.Semaphore] = None
-    ) -> List[Any]:
+        summaries = self._schemes_summary
+        self._schemes_responses: Dict[bool, Dict[str, Any]] = {}
+        for include_parts in (True, False):
+            filtered = (
+                summaries if include_parts
+                else [s for s in summaries if "_part" not in s["id"]]
+            )
+            self._schemes_responses[include_parts] = {
+                "schemes": filtered,
+                "total": len(filtered),
+                "status": "success"
+            }
+
+    @property
+    def _compiled_cache_path(self) -> Path:
+        return self.schemes_dir / "_compiled.json"
+
+    def _load_compiled_schemes(
+        self, yaml_files: List[Path]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load schemes from the compiled JSON blob if it is still fresh.
+
+        Returns None (forcing a YAML parse) when the blob is missing, any
+        YAML source is newer than the blob, or the set of source files
+        changed.
         """
-        Run tasks with concurrency limit using a semaphore.
-        
-        Args:
-            tasks: List of asyncio tasks to execute
-            semaphore: Optional semaphore for limiting concurrency
-            
+        cache_path = self._compiled_cache_path
+        try:
+            if not cache_path.exists():
+                return None
+
+            blob = orjson.loads(cache_path.read_bytes())
+            if blob.get("sources") != self._source_signature(yaml_files):
+                logger.debug("Scheme sources changed, re-parsing YAML")
+                return None
+
+            schemes = blob["schemes"]
+            for scheme in schemes.values():
+                self._restore_compiled_types(scheme)
+            logger.debug(f"Loaded {len(schemes)} schemes from compiled cache")
+            return schemes
+        except Exception as e:
+            logger.warning(f"Failed to read compiled scheme cache: {e}")
+            return None
+
+    def _write_compiled_schemes(self, yaml_files: List[Path]) -> None:
+        """Persist parsed schemes as a JSON blob for fast future startups.
+
+        Best effort: read-only deployments (e.g. serverless bundles) simply
+        keep parsing YAML.
+        """
+        if not self.schemes:
+            return
+        try:
+            blob = orjson.dumps(
+                {
+                    "sources": self._source_signature(yaml_files),
+                    "schemes": self.schemes,
+                },
+                # Checklist level keys are ints; restored on load
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+            # Atomic write so a concurrent start never sees a partial blob
+            cache_path = self._compiled_cache_path
+            tmp_path = cache_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, cache_path)
+            logger.debug(f"Wrote compiled scheme cache to {cache_path}")
+        except Exception as e:
+            logger.debug(f"Could not write compiled scheme cache: {e}")
+
+    @staticmethod
+    def _source_signature(yaml_files: List[Path]) -> List[List[Any]]:
+        """Fingerprint the YAML sources as (name, mtime_ns, size) triples.
+
+        Stored in the compiled blob; any rename, edit, addition or removal
+        changes the signature and forces a YAML re-parse.
+        """
+        return [
+            [f.name, stat.st_mtime_ns, stat.st_size]
+            for f in yaml_files
+            for stat in (f.stat(),)
+        ]
+
+    @staticmethod
+    def _restore_compiled_types(scheme: Dict[str, Any]) -> None:
+        """Undo JSON key stringification after loading the compiled blob.
+
+        Checklist item `values` use integer level keys in YAML; JSON forces
+        them to strings, and the scoring code relies on `isinstance(k, int)`.
+        """
+        for item in scheme.get('items', []):
+            values = item.get('values')
+            if isinstance(values, dict):
+                item['values'] = {
+                    (int(k) if isinstance(k, str) and k.lstrip('-').isdigit() else k): v
+                    for k, v in values.items()
+                }
+
+    @property
+    def scheme_ids(self) -> frozenset:
+        """Set of all loaded scheme IDs for fast membership checks."""
+        return self._scheme_ids
+
+    def get_schemes_response(self, include_parts: bool = False) -> Dict[str, Any]:
+        """Return the pre-built /schemes response payload."""
+        return self._schemes_responses[include_parts]
+
+    def get_schemes(self) -> List[Dict[str, Any]]:
+        """Get list of available schemes (precomputed at load time)."""
+        return self._schemes_summary
+    
+    async def _gather_evaluations(self, tasks: List[Any]) -> List[Any]:
+        """Run evaluation coroutines concurrently, capturing exceptions.
+
+        Concurrency is not limited at this level: the LLM semaphore is
+        acquired around the individual chat completion in
+        _cached_completion, so a derived evaluation holding a slot can no
+        longer hide an arbitrary number of nested LLM calls behind it,
+        and cache hits skip the semaphore entirely.
+
         Returns:
             List of results in the same order as input tasks
         """
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _get_sem(self) -> asyncio.Semaphore:
+        """Return the engine-wide LLM semaphore, creating it on first use.
+
+        One shared semaphore instead of a fresh one per call: previously
+        every evaluate_text invocation and _evaluate_derived recursion that
+        received no semaphore minted its own, multiplying the effective
+        concurrency by the number of callers. Lazy so the semaphore is
+        created on the loop that actually runs the evaluations.
+        """
+        if self._llm_sem is None:
+            self._llm_sem = asyncio.Semaphore(self.max_concurrent_llm_calls)
+        return self._llm_sem
+
+
+    async def _cached_completion(
+        self,
+        llm_client: Any,
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: Optional[int] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> str:
+        """Issue a chat completion, cached by exact request hash.
+
+        The key is the SHA-256 of the canonicalized (model, messages,
+        temperature, max_tokens) payload, so identical requests hit the
+        cache with zero false positives.
+
+        The concurrency semaphore is acquired here, around the actual API
+        call only: cache hits never occupy a slot, and one slot corresponds
+        to exactly one in-flight request upstream.
+
+        Returns:
+            The completion message content.
+        """
+        messages = [{"role": "user", "content": prompt}]
+        key = hashlib.sha256(orjson.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )).digest()
+
+        cached = self._completion_cache.get(key)
+        if cached is not None:
+            logger.debug("Completion cache hit")
+            return cached
+
+        cached = self._disk_cache_get(key)
+        if cached is not None:
+            logger.debug("Durable completion cache hit")
+            self._completion_cache[key] = cached
+            return cached
+
         if semaphore is None:
-            semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
-        
-        async def run_with_semaphore(task):
-            async with semaphore:
-                return await task
-        
-        # Wrap all tasks with semaphore
-        limited_tasks = [run_with_semaphore(task) for task in tasks]
-        
-        # Execute all tasks (semaphore limits actual concurrency)
-        return await asyncio.gather(*limited_tasks, return_exceptions=True)
-    
+            semaphore = self._get_sem()
+        async with semaphore:
+            response = await llm_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        content = response.choices[0].message.content
+        self._completion_cache[key] = content
+        self._disk_cache_put(key, content)
+        return content
+
+    def _disk_cache_get(self, key: bytes) -> Optional[str]:
+        """Look up a completion in the durable cache (None on miss/expiry).
+
+        A single indexed point read, cheap enough to run inline on the
+        event loop. Best effort: any SQLite error degrades to a miss.
+        """
+        if self._disk_cache is None:
+            return None
+        try:
+            row = self._disk_cache.execute(
+                "SELECT value, created_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+        except Exception as e:
+            logger.debug(f"Durable cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        value, created_at = row
+        # Same TTL as the in-memory tier
+        if time.time() - created_at > self._completion_cache.ttl:
+            return None
+        return value
+
+    def _disk_cache_put(self, key: bytes, content: str) -> None:
+        """Best-effort insert into the durable completion cache."""
+        if self._disk_cache is None:
+            return
+        try:
+            self._disk_cache.execute(
+                "INSERT OR REPLACE INTO completions VALUES (?, ?, ?)",
+                (key, content, int(time.time())),
+            )
+            self._disk_cache.commit()
+        except Exception as e:
+            logger.debug(f"Durable cache write failed: {e}")
+
+    async def _coalesced_evaluation(
+        self,
+        key: tuple,
+        factory: Any,
+    ) -> Dict[str, Any]:
+        """Run a single scheme evaluation with caching and coalescing.
+
+        Checks the cross-request TTL cache first, otherwise dispatches via
+        the single-flight coalescer and stores successful results.
+
+        Args:
+            key: Cache/coalescing key (scheme_id, text_hash, model, context_type)
+            factory: Zero-argument callable returning the evaluation coroutine
+        """
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Result cache hit for {key[0]}")
+            return cached
+
+        result = await self._coalescer.run(key, factory)
+
+        # Don't pin failures for the full TTL - only cache real results
+        if result.get("na_reason") is None:
+            self._result_cache[key] = result
+
+        return result
+
     async def evaluate_text(
         self,
         text: str,
@@ -93,46 +498,96 @@ class EvaluationEngine:
         llm_client: Any,
         model: str,
         gates_passed: bool = True,
-        context_type: str = "content"
+        context_type: str = "content",
+        semaphore: Optional[asyncio.Semaphore] = None,
+        text_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """Evaluate text using specified schemes.
-        
+
         Uses request-scoped caching to avoid duplicate evaluations when:
         - A scheme appears both directly and as a dependency
         - Multiple derived schemas share the same dependency
+
+        Args:
+            semaphore: Optional process-wide semaphore bounding concurrent
+                LLM calls across requests (defaults to a per-call limit)
+            text_hash: Optional precomputed blake2b hex digest of the text,
+                so callers that already hashed it avoid a second scan
         """
         results = []
         gates_passed = True
-        
+
         # Request-scoped cache: scheme_id -> evaluation result
         # This prevents duplicate LLM calls for the same schema
         results_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Identity of this text for cross-request coalescing of identical
+        # concurrent evaluations
+        if text_hash is None:
+            text_hash = hash_text(text)
         
-        # Process binary gates first
+        # Resolve ids to (scheme, type) once up front; the gate pass and the
+        # parallel pass below both reuse this instead of repeating the dict
+        # lookup and ScaleType parsing per pass
+        resolved = []
         for scheme_id in scheme_ids:
             scheme = self.schemes.get(scheme_id)
             if not scheme:
                 continue
 
-            try:
-                scheme_type = ScaleType(scheme["type"])
-            except (KeyError, ValueError):
-                logger.warning(f"Unknown scheme type for {scheme_id}: {scheme.get('type')}")
+            # Type coerced once at load; None means it was flagged there
+            scheme_type = self._scale_types.get(scheme_id)
+            if scheme_type is None:
                 continue
 
-            if scheme_type is ScaleType.BINARY_GATE:
-                # Check cache first
-                if scheme_id in results_cache:
-                    result = results_cache[scheme_id]
-                    logger.debug(f"Using cached result for {scheme_id}")
-                else:
-                    result = await self._evaluate_binary_gate(text, scheme, llm_client, model, context_type)
-                    results_cache[scheme_id] = result
+            resolved.append((scheme_id, scheme, scheme_type))
+
+        # Process binary gates first. Gates are independent until one fails,
+        # so they run concurrently; the first failure cancels the remaining
+        # waiters instead of paying the rest of the round-trips. (Cancelling
+        # a waiter is safe: the coalescer shields the shared in-flight task,
+        # so a duplicate request elsewhere still gets its result.)
+        gate_items = [
+            (scheme_id, scheme)
+            for scheme_id, scheme, scheme_type in resolved
+            if scheme_type is ScaleType.BINARY_GATE
+        ]
+        if gate_items:
+            gate_tasks: Dict[str, asyncio.Task] = {}
+            for scheme_id, scheme in gate_items:
+                if scheme_id in gate_tasks:
+                    continue
+                gate_tasks[scheme_id] = asyncio.create_task(self._coalesced_evaluation(
+                    (scheme_id, text_hash, model, context_type),
+                    partial(self._evaluate_binary_gate, text, scheme, llm_client, model,
+                            context_type, semaphore),
+                ))
+
+            pending = set(gate_tasks.values())
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    # Failed gates report value 0 (None means the gate
+                    # errored and is treated as pass-through)
+                    if any(task.result()["value"] == 0 for task in done):
+                        gates_passed = False
+                        break
+            finally:
+                for task in pending:
+                    task.cancel()
+
+            # Collect finished gates in request order; cancelled ones (only
+            # possible after a failure) are simply not reported
+            for scheme_id, scheme in gate_items:
+                task = gate_tasks[scheme_id]
+                if not task.done() or task.cancelled():
+                    continue
+                result = task.result()
+                results_cache[scheme_id] = result
                 results.append(result)
-                if result["value"] is False:
-                    gates_passed = False
-                    break
-        
+
         # If gates failed, return early
         if not gates_passed:
             return {
@@ -146,38 +601,39 @@ class EvaluationEngine:
         eval_tasks = []
         scheme_order = []  # Track order for maintaining result sequence
         
-        for scheme_id in scheme_ids:
-            scheme = self.schemes.get(scheme_id)
-            if not scheme:
-                continue
-
-            try:
-                scheme_type = ScaleType(scheme["type"])
-            except (KeyError, ValueError):
-                logger.warning(f"Unknown scheme type for {scheme_id}: {scheme.get('type')}")
-                continue
-
+        for scheme_id, scheme, scheme_type in resolved:
             if scheme_type is ScaleType.BINARY_GATE:
                 continue
-            
-            scheme_order.append(scheme_id)
-            
+
             # Check cache first - avoid duplicate evaluation
             if scheme_id in results_cache:
                 logger.debug(f"Using cached result for {scheme_id}")
                 results.append(results_cache[scheme_id])
                 continue
-            
-            if scheme_type is ScaleType.ORDINAL_RUBRIC:
-                eval_tasks.append(self._evaluate_ordinal_rubric(text, scheme, llm_client, model))
-            elif scheme_type is ScaleType.CHECKLIST_ADDITIVE:
-                eval_tasks.append(self._evaluate_checklist_additive(text, scheme, llm_client, model))
-            elif scheme_type is ScaleType.DERIVED:
-                eval_tasks.append(self._evaluate_derived(text, scheme, llm_client, model, context_type, results_cache))
-        
+
+            # Only schemes that actually get a task keep the gathered results
+            # aligned with scheme_order below
+            scheme_order.append(scheme_id)
+
+            coalesce_key = (scheme_id, text_hash, model, context_type)
+            handler = self._scale_handlers.get(scheme_type)
+            if handler is not None:
+                eval_tasks.append(self._coalesced_evaluation(
+                    coalesce_key,
+                    partial(handler, text, scheme, llm_client, model, semaphore),
+                ))
+            else:
+                # Derived schemes depend on a request-scoped cache, so they
+                # are not shared across requests
+                eval_tasks.append(
+                    self._evaluate_derived(
+                        text, scheme, llm_client, model, context_type, results_cache, semaphore
+                    )
+                )
+
         # Execute all evaluations in parallel (with concurrency limit)
         if eval_tasks:
-            parallel_results = await self._run_with_concurrency_limit(eval_tasks)
+            parallel_results = await self._gather_evaluations(eval_tasks)
             
             # Handle results and potential exceptions
             for i, result in enumerate(parallel_results):
@@ -217,76 +673,46 @@ class EvaluationEngine:
         llm_client: Any,
         model: str,
         context_type: str = "content",
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> Dict[str, Any]:
         """Evaluate binary gate (KO criteria)."""
         prompt = self._build_gate_prompt(text, scheme, context_type)
-        
+
         try:
-            response = await llm_client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1
+            # Budget one line per gate rule on top of RESULT/REASONING
+            max_tokens = _GATE_BASE_TOKENS + _GATE_TOKENS_PER_ASPECT * len(scheme.get('gate_rules', []))
+            content = await self._cached_completion(
+                llm_client, model, prompt, temperature=0.0,
+                max_tokens=max_tokens, semaphore=semaphore
             )
-            
-            content = response.choices[0].message.content
-            
-            # Parse structured response
-            passed = None
-            reasoning = "No evaluation found"
-            
-            for line in content.split('\n'):
-                if line.strip().startswith('RESULT:'):
-                    result_part = line.split(':', 1)[1].strip().upper()
-                    passed = result_part in ['JA', 'YES', 'TRUE']
-                elif line.strip().startswith('REASONING:'):
-                    reasoning = line.split(':', 1)[1].strip()
-            
-            # Calculate overall pass/fail based on individual aspects
-            gate_rules = scheme.get('gate_rules', [])
-            all_aspects_passed = True
-            
-            if gate_rules:
-                for i, rule in enumerate(gate_rules, 1):
-                    # Look for ASPEKT_X pattern in response
-                    for line in content.split('\n'):
-                        if line.strip().startswith(f'ASPEKT_{i}:'):
-                            parts = line.split(':', 1)[1].strip()
-                            response_part = parts.split(' - ')[0] if ' - ' in parts else parts
-                            # NEIN = kein Verstoß = BESTANDEN (inverted logic for gates)
-                            aspect_passed = response_part.strip().upper() in ['NEIN', 'NO', 'FALSE']
-                            if not aspect_passed:
-                                all_aspects_passed = False
-                            break
-                
-                passed = all_aspects_passed
-            else:
-                # Fallback parsing for overall result
-                if passed is None:
-                    content_lower = content.lower()
-                    passed = "ja" in content_lower or "yes" in content_lower or "true" in content_lower
-            
-            reasoning = content.strip()
-            
-            # Parse individual aspects from gate rules
-            gate_rules = scheme.get('gate_rules', [])
+
+            # Parse the structured response in one regex pass
+            parsed = _parse_tagged_response(content)
+
+            result_part = parsed.get('RESULT')
+            passed = result_part.upper() in ['JA', 'YES', 'TRUE'] if result_part is not None else None
+
+            # Walk the gate rules once, deriving the per-aspect breakdown and
+            # the overall pass/fail in the same pass
+            gate_rules = self._gate_rule_keys(scheme)
             criteria_results = {}
-            
+            all_aspects_passed = True
+
             if gate_rules:
-                for i, rule in enumerate(gate_rules, 1):
-                    aspect_key = f"aspekt_{i}"
+                for aspect_key, aspect_tag, rule in gate_rules:
                     aspect_passed = True  # Default to pass
                     aspect_reasoning = "Keine spezifische Bewertung gefunden"
-                    
-                    # Look for ASPEKT_X pattern in response
-                    for line in content.split('\n'):
-                        if line.strip().startswith(f'ASPEKT_{i}:'):
-                            parts = line.split(':', 1)[1].strip()
-                            if ' - ' in parts:
-                                response_part, aspect_reasoning = parts.split(' - ', 1)
-                                # NEIN = kein Verstoß = BESTANDEN (inverted logic for gates)
-                                aspect_passed = response_part.strip().upper() in ['NEIN', 'NO', 'FALSE']
-                            break
-                    
+
+                    aspect_line = parsed.get(aspect_tag)
+                    if aspect_line is not None:
+                        response_part, _, rest = aspect_line.partition(' - ')
+                        if rest:
+                            aspect_reasoning = rest
+                        # NEIN = kein Verstoß = BESTANDEN (inverted logic for gates)
+                        aspect_passed = response_part.strip().upper() in ['NEIN', 'NO', 'FALSE']
+                        if not aspect_passed:
+                            all_aspects_passed = False
+
                     criteria_results[aspect_key] = {
                         "passed": aspect_passed,
                         "reasoning": aspect_reasoning,
@@ -296,7 +722,16 @@ class EvaluationEngine:
                         "action": rule.get('action'),
                         "rule_id": rule.get('id')
                     }
-            
+
+                passed = all_aspects_passed
+            else:
+                # Fallback parsing for overall result
+                if passed is None:
+                    content_lower = content.lower()
+                    passed = "ja" in content_lower or "yes" in content_lower or "true" in content_lower
+
+            reasoning = content.strip()
+
             # Enhanced reasoning for binary gates - extract only main reasoning
             main_reasoning = ""
             if "REASONING:" in reasoning:
@@ -315,8 +750,7 @@ class EvaluationEngine:
             # Collect legal violations for failed gates
             legal_violations = []
             if not passed and gate_rules:
-                for i, rule in enumerate(gate_rules, 1):
-                    aspect_key = f"aspekt_{i}"
+                for aspect_key, _aspect_tag, rule in gate_rules:
                     if aspect_key in criteria_results and not criteria_results[aspect_key].get('passed', True):
                         violation = {
                             "rule_id": rule.get('id'),
@@ -357,35 +791,30 @@ class EvaluationEngine:
         scheme: Dict[str, Any],
         llm_client: Any,
         model: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> Dict[str, Any]:
         """Evaluate using ordinal rubric with anchors."""
         prompt = self._build_rubric_prompt(text, scheme)
-        
+
         try:
-            response = await llm_client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.2
+            content = await self._cached_completion(
+                llm_client, model, prompt, temperature=0.0,
+                max_tokens=_RUBRIC_MAX_TOKENS, semaphore=semaphore
             )
-            
-            content = response.choices[0].message.content
-            
-            # Parse structured response
+
+            # Parse the structured response in one regex pass
+            parsed = _parse_tagged_response(content)
+
             score = None
-            label = None
-            reasoning = "No evaluation found"
-            
-            for line in content.split('\n'):
-                if line.strip().startswith('SCORE:'):
-                    try:
-                        score = int(line.split(':', 1)[1].strip())
-                    except ValueError:
-                        pass
-                elif line.strip().startswith('LABEL:'):
-                    label = line.split(':', 1)[1].strip()
-                elif line.strip().startswith('REASONING:'):
-                    reasoning = line.split(':', 1)[1].strip()
-            
+            score_part = parsed.get('SCORE')
+            if score_part is not None:
+                try:
+                    score = int(score_part)
+                except ValueError:
+                    pass
+            label = parsed.get('LABEL')
+            reasoning = parsed.get('REASONING', "No evaluation found")
+
             # Fallback to anchor matching if structured parsing failed
             if score is None:
                 if scheme.get("selection_strategy") == SelectionStrategy.FIRST_MATCH:
@@ -396,16 +825,14 @@ class EvaluationEngine:
                 label = result.get("label")
                 reasoning = content.strip()
             
-            # Find matching anchor for label if not parsed
+            # Find matching anchor for label if not parsed (O(1) lookup)
+            label_by_value, anchor_levels = self._rubric_anchor_info(scheme)
             if label is None and score is not None:
-                for anchor in scheme.get('anchors', []):
-                    if anchor['value'] == score:
-                        label = anchor['label']
-                        break
-            
+                label = label_by_value.get(score)
+
             # Enhanced reasoning for ordinal rubrics
             enhanced_reasoning = f"**Bewertung:** Level {score} - {label}\n\n**Begründung:** {reasoning}"
-            
+
             return {
                 "scheme_id": scheme["id"],
                 "dimension": scheme["dimension"],
@@ -415,8 +842,8 @@ class EvaluationEngine:
                 "scale_info": {
                     "type": "ordinal_rubric",
                     "range": scheme.get("output_range", {}),
-                    "anchors": len(scheme.get('anchors', [])),
-                    "levels": [f"{a['value']}: {a['label']}" for a in scheme.get('anchors', [])]
+                    "anchors": len(anchor_levels),
+                    "levels": anchor_levels
                 },
                 "confidence": 0.8 if score is not None else 0.6
             }
@@ -436,49 +863,51 @@ class EvaluationEngine:
         scheme: Dict[str, Any],
         llm_client: Any,
         model: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> Dict[str, Any]:
         """Evaluate using additive checklist."""
         prompt = self._build_checklist_prompt(text, scheme)
-        
+
         try:
-            response = await llm_client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1
+            content = await self._cached_completion(
+                llm_client, model, prompt, temperature=0.0,
+                max_tokens=_CHECKLIST_MAX_TOKENS, semaphore=semaphore
             )
-            
-            content = response.choices[0].message.content
-            
+
             # Parse checklist responses and calculate weighted score
             score, criterion_results = self._calculate_checklist_score(content, scheme)
-            
-            # Generate detailed LLM reasoning
-            reasoning_prompt = f"""
-Erstellen Sie eine ausführliche Bewertung für die Dimension '{scheme.get('dimension', 'quality')}' basierend auf folgenden Einzelkriterien:
 
-{chr(10).join([f"- {item.get('prompt', item.get('id', ''))}: Level {criterion_results.get(item.get('id', ''), {}).get('response', 'unbekannt')}" for item in scheme.get('items', [])])}
+            # Bind the chained lookups once; both the reasoning and the
+            # scale_info blocks below read them
+            items = scheme.get('items', [])
+            aggregator_params = scheme.get('aggregator', {}).get('params', {})
 
-Gesamtscore: {score:.2f} von {scheme.get('aggregator', {}).get('params', {}).get('scale_factor', 5.0)}
+            # Build the narrative reasoning locally. The scoring response
+            # already contains a per-criterion justification and a closing
+            # summary, so a second LLM round-trip just to re-narrate the
+            # result doubled latency and token cost for no new information.
+            scale_max = aggregator_params.get('scale_factor', 5.0)
+            percentage = (score / scale_max) * 100 if scale_max else 0
+            dimension_name = scheme.get('dimension', 'quality').title()
+            reasoning_parts = [
+                f"Bewertung für {dimension_name}: {score:.2f} von {scale_max} Punkten ({percentage:.0f}%)."
+            ]
+            scored = [
+                (criterion['name'], criterion)
+                for criterion in criterion_results.values()
+                if criterion.get('normalized_score') is not None
+            ]
+            if scored:
+                best_name, best = max(scored, key=lambda entry: entry[1]['normalized_score'])
+                worst_name, worst = min(scored, key=lambda entry: entry[1]['normalized_score'])
+                reasoning_parts.append(f"Stärkstes Kriterium: {best_name} (Level {best['response']}).")
+                if worst is not best:
+                    reasoning_parts.append(f"Schwächstes Kriterium: {worst_name} (Level {worst['response']}).")
+            detailed_reasoning = " ".join(reasoning_parts)
 
-Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die die wichtigsten Stärken und Schwächen erklärt.
-"""
-            
-            try:
-                reasoning_response = await llm_client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": reasoning_prompt}],
-                    temperature=0.3
-                )
-                detailed_reasoning = reasoning_response.choices[0].message.content.strip()
-            except Exception:
-                # Fallback to simple reasoning
-                percentage = (score / scheme.get('aggregator', {}).get('params', {}).get('scale_factor', 5.0)) * 100
-                dimension_name = scheme.get('dimension', 'quality').title()
-                detailed_reasoning = f"Bewertung für {dimension_name}: {percentage:.0f}% der möglichen Punkte erreicht."
-            
             # Build scale info from first item's values
-            first_item = scheme.get('items', [{}])[0] if scheme.get('items') else {}
-            scale_factor = scheme.get('aggregator', {}).get('params', {}).get('scale_factor', 1.0)
+            first_item = items[0] if items else {}
+            scale_factor = aggregator_params.get('scale_factor', 1.0)
             raw_values = first_item.get('values', {})
             
             # Convert values to proper format for scale_info
@@ -520,7 +949,8 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
         llm_client: Any,
         model: str,
         context_type: str = "content",
-        results_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        results_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
     ) -> Dict[str, Any]:
         """Evaluate a derived scheme by aggregating dependency results.
 
@@ -530,6 +960,7 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
 
         Args:
             results_cache: Request-scoped cache of already evaluated schemas.
+            semaphore: Optional shared semaphore bounding concurrent LLM calls.
         """
         if results_cache is None:
             results_cache = {}
@@ -561,36 +992,38 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
                     dependency_results.append(results_cache[dep_scheme_id])
                     continue
                 
-                dependency_order.append(dep_scheme_id)
-                try:
-                    dep_type = ScaleType(dep_scheme["type"])
-                except (KeyError, ValueError):
-                    logger.warning(
-                        f"Unknown dependency scheme type for {dep_scheme_id}: {dep_scheme.get('type')}"
-                    )
+                # Type coerced once at load; None means it was flagged there
+                dep_type = self._scale_types.get(dep_scheme_id)
+                if dep_type is None:
                     continue
 
+                # Only record the id once a task is actually scheduled, so
+                # dependency_order stays aligned with dependency_tasks
+                dependency_order.append(dep_scheme_id)
+
                 if dep_type is ScaleType.CHECKLIST_ADDITIVE:
                     dependency_tasks.append(
-                        self._evaluate_checklist_additive(text, dep_scheme, llm_client, model)
+                        self._evaluate_checklist_additive(text, dep_scheme, llm_client, model, semaphore)
                     )
                 elif dep_type is ScaleType.ORDINAL_RUBRIC:
                     dependency_tasks.append(
-                        self._evaluate_ordinal_rubric(text, dep_scheme, llm_client, model)
+                        self._evaluate_ordinal_rubric(text, dep_scheme, llm_client, model, semaphore)
                     )
                 elif dep_type is ScaleType.BINARY_GATE:
                     dependency_tasks.append(
-                        self._evaluate_binary_gate(text, dep_scheme, llm_client, model, context_type)
+                        self._evaluate_binary_gate(text, dep_scheme, llm_client, model, context_type, semaphore)
                     )
                 elif dep_type is ScaleType.DERIVED:
                     # Recursively evaluate nested derived schemas with cache
                     dependency_tasks.append(
-                        self._evaluate_derived(text, dep_scheme, llm_client, model, context_type, results_cache)
+                        self._evaluate_derived(
+                            text, dep_scheme, llm_client, model, context_type, results_cache, semaphore
+                        )
                     )
 
             # Execute all dependency evaluations in parallel (with concurrency limit)
             if dependency_tasks:
-                parallel_dep_results = await self._run_with_concurrency_limit(dependency_tasks)
+                parallel_dep_results = await self._gather_evaluations(dependency_tasks)
                 
                 for i, result in enumerate(parallel_dep_results):
                     dep_scheme_id = dependency_order[i]
@@ -612,9 +1045,10 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
             # Apply derivation rules
             rules = scheme.get("rules", [])
             logger.debug(f"Checking {len(rules)} rules for scheme {scheme['id']}")
-            logger.debug(
+            # lazy: the summary comprehension only runs when DEBUG is active
+            logger.opt(lazy=True).debug(
                 "Dependency results: {}",
-                [
+                lambda: [
                     (dep.get('scheme_id'), dep.get('dimension'), dep.get('value'))
                     for dep in dependency_results
                 ],
@@ -661,43 +1095,31 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
                                 "dependencies": len(dependencies),
                                 "weights": weights
                             },
-                            "criteria": {
-                                dep["scheme_id"]: {
-                                    "dimension": dep["dimension"],
-                                    "value": dep.get("value"),
-                                    "label": dep.get("label"),
-                                    "weight": weights.get(dep.get("dimension"), 1.0),
-                                    "confidence": dep.get("confidence"),
-                                    "reasoning": dep.get("reasoning"),
-                                    "criteria": dep.get("criteria"),
-                                    "scale_info": dep.get("scale_info")
-                                }
-                                for dep in dependency_results if dep.get("value") is not None
-                            }
+                            "criteria": self._build_criteria_dict(dependency_results, weights=weights)
                         }
                     elif rule["value"] == "sum":
-                        # Calculate sum of all dependency values (for split schemas)
+                        # Calculate sum of all dependency values (for split
+                        # schemas), collecting the per-part reasoning lines
+                        # in the same pass
                         total_sum = 0
                         count = 0
-                        
+                        contribution_lines = []
+
                         for dep_result in dependency_results:
                             value = dep_result.get("value")
                             if value is not None and isinstance(value, (int, float)):
                                 total_sum += value
                                 count += 1
-                        
-                        # Build reasoning for sum aggregation
-                        reasoning_parts = [f"**Gesamtsumme:** {total_sum:.2f} (aus {count} Teilschemas)\n"]
-                        reasoning_parts.append("**Einzelbeiträge:**")
-                        for dep in dependency_results:
-                            if dep.get("value") is not None:
-                                scheme_id = dep.get("scheme_id", "unknown")
-                                value = dep.get("value")
-                                label = dep.get("label", "")
-                                reasoning_parts.append(f"- {scheme_id}: {value} ({label})")
-                        
-                        reasoning_parts.append(f"\n**Berechnung:** Summe aller Teilwerte = {total_sum:.2f}")
-                        detailed_reasoning = "\n".join(reasoning_parts)
+                                contribution_lines.append(
+                                    f"- {dep_result.get('scheme_id', 'unknown')}: {value} ({dep_result.get('label', '')})"
+                                )
+
+                        detailed_reasoning = "\n".join([
+                            f"**Gesamtsumme:** {total_sum:.2f} (aus {count} Teilschemas)\n",
+                            "**Einzelbeiträge:**",
+                            *contribution_lines,
+                            f"\n**Berechnung:** Summe aller Teilwerte = {total_sum:.2f}",
+                        ])
                         
                         return {
                             "scheme_id": scheme["id"],
@@ -712,18 +1134,7 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
                                 "dependencies": len(dependencies),
                                 "components": count
                             },
-                            "criteria": {
-                                dep["scheme_id"]: {
-                                    "dimension": dep["dimension"],
-                                    "value": dep.get("value"),
-                                    "label": dep.get("label"),
-                                    "confidence": dep.get("confidence"),
-                                    "reasoning": dep.get("reasoning"),
-                                    "criteria": dep.get("criteria"),
-                                    "scale_info": dep.get("scale_info")
-                                }
-                                for dep in dependency_results if dep.get("value") is not None
-                            }
+                            "criteria": self._build_criteria_dict(dependency_results)
                         }
                     else:
                         # Static rule value - build detailed reasoning for binary compliance
@@ -742,19 +1153,7 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
                                 "dependencies": len(dependencies),
                                 "conditions": rule.get("conditions", [])
                             },
-                            "criteria": {
-                                dep["scheme_id"]: {
-                                    "dimension": dep["dimension"],
-                                    "value": dep.get("value"),
-                                    "label": dep.get("label"),
-                                    "passed": dep.get("value") == 1 if isinstance(dep.get("value"), int) else True,
-                                    "confidence": dep.get("confidence"),
-                                    "reasoning": dep.get("reasoning"),
-                                    "criteria": dep.get("criteria"),
-                                    "scale_info": dep.get("scale_info")
-                                }
-                                for dep in dependency_results if dep.get("value") is not None
-                            }
+                            "criteria": self._build_criteria_dict(dependency_results, include_passed=True)
                         }
             
             # Default if no rules match - build detailed reasoning for failed compliance
@@ -774,25 +1173,19 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
                     "dependencies": len(dependencies),
                     "conditions": "default_fallback"
                 },
-                "criteria": {
-                    dep["scheme_id"]: {
-                        "dimension": dep["dimension"],
-                        "value": dep.get("value"),
-                        "label": dep.get("label"),
-                        "passed": dep.get("value") == 1 if isinstance(dep.get("value"), int) else True,
-                        "confidence": dep.get("confidence"),
-                        "reasoning": dep.get("reasoning"),
-                        "criteria": dep.get("criteria"),
-                        "scale_info": dep.get("scale_info")
-                    }
-                    for dep in dependency_results if dep.get("value") is not None
-                }
+                "criteria": self._build_criteria_dict(dependency_results, include_passed=True)
             }
             
         except Exception as e:
             logger.error(f"Derived evaluation failed: {e}")
             logger.error(f"Dependencies: {dependencies}")
-            logger.error(f"Dependency results: {[{k: v for k, v in dep.items() if k in ['scheme_id', 'dimension', 'value', 'label']} for dep in dependency_results]}")
+            logger.error(
+                "Dependency results: {}",
+                [
+                    {k: dep[k] for k in _DEP_LOG_FIELDS if k in dep}
+                    for dep in dependency_results
+                ],
+            )
             return {
                 "scheme_id": scheme["id"],
                 "dimension": scheme["dimension"],
@@ -800,6 +1193,41 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
                 "na_reason": f"Derivation error: {str(e)}"
             }
     
+    def _build_criteria_dict(
+        self,
+        dependency_results: List[Dict[str, Any]],
+        weights: Optional[Dict[str, float]] = None,
+        include_passed: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Build the per-dependency criteria breakdown for derived results.
+
+        Shared by the weighted-average, sum and rule-based return paths of
+        _evaluate_derived, which previously each inlined a near-identical
+        comprehension. Dependencies without a value are skipped; weights
+        adds a per-entry weight, include_passed the pass flag used by the
+        rule-based paths.
+        """
+        criteria: Dict[str, Dict[str, Any]] = {}
+        for dep in dependency_results:
+            value = dep.get("value")
+            if value is None:
+                continue
+            entry = {
+                "dimension": dep["dimension"],
+                "value": value,
+                "label": dep.get("label"),
+            }
+            if weights is not None:
+                entry["weight"] = weights.get(dep.get("dimension"), 1.0)
+            if include_passed:
+                entry["passed"] = value == 1 if isinstance(value, int) else True
+            entry["confidence"] = dep.get("confidence")
+            entry["reasoning"] = dep.get("reasoning")
+            entry["criteria"] = dep.get("criteria")
+            entry["scale_info"] = dep.get("scale_info")
+            criteria[dep["scheme_id"]] = entry
+        return criteria
+
     def _build_derived_reasoning(self, dependency_results, final_score, weights, rule):
         """Build concise reasoning for weighted average derived schemas."""
         summary_lines = []
@@ -813,14 +1241,17 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
             weight = weights.get(dimension, 1.0)
             sub_reasoning = dep.get("reasoning", "").strip()
 
-            # Extract the most informative fragment from the sub-reasoning
-            if sub_reasoning:
-                reasoning_lines = [line.strip() for line in sub_reasoning.split("\n") if line.strip()]
-                excerpt = reasoning_lines[0]
-                if len(reasoning_lines) > 1:
-                    excerpt = f"{excerpt} {reasoning_lines[1]}".strip()
-            else:
-                excerpt = f"Bewertung {label}."
+            # Extract the most informative fragment from the sub-reasoning:
+            # the first two non-empty lines, stopping there instead of
+            # stripping and collecting the whole blob
+            excerpt_lines = []
+            for line in sub_reasoning.splitlines():
+                line = line.strip()
+                if line:
+                    excerpt_lines.append(line)
+                    if len(excerpt_lines) == 2:
+                        break
+            excerpt = " ".join(excerpt_lines) if excerpt_lines else f"Bewertung {label}."
 
             summary_lines.append(
                 f"- **{dimension}** ({label}, Gewicht {weight}): {excerpt}"
@@ -840,103 +1271,83 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
     
     def _build_compliance_reasoning(self, dependency_results, rule):
         """Build detailed reasoning for compliance-based derived schemas."""
-        passed_count = 0
+        # Failed gates are formatted directly in this single pass; the
+        # intermediate per-gate detail dicts were only ever read once by a
+        # second loop immediately afterwards
+        reasoning_parts = []
         failed_count = 0
-        failed_gates_details = []
-        
-        # Count passed/failed and collect details of failed gates
+
         for dep in dependency_results:
+            if dep.get("value") == 1:
+                continue
+            failed_count += 1
+
             gate_name = dep.get("scheme_id", "unknown")
-            value = dep.get("value")
             label = dep.get("label", "")
             reasoning = dep.get("reasoning", "")
             criteria = dep.get("criteria", {})
             scale_info = dep.get("scale_info", {})
-            
-            if value == 1:
-                passed_count += 1
+
+            # Extract the "Begründung:" section (usually after
+            # "**Ergebnis:**") in one regex pass instead of splitting and
+            # scanning every line of the reasoning blob
+            match = _BEGRUENDUNG_RE.search(reasoning)
+            if match:
+                begründung_text = match.group(1)
             else:
-                failed_count += 1
-                
-                # Extract meaningful reasoning from gate
-                reasoning_lines = [line.strip() for line in reasoning.split('\n') if line.strip()]
-                # Get "Begründung:" section (usually after "**Ergebnis:**")
-                begründung_text = ""
-                for i, line in enumerate(reasoning_lines):
-                    if line.startswith('**Begründung:**'):
-                        # Take this line and the next few sentences (up to 3-4 lines)
-                        begründung_text = ' '.join(reasoning_lines[i:i+4])
-                        break
-                
-                if not begründung_text and len(reasoning_lines) > 1:
-                    # Fallback: take lines after first line
-                    begründung_text = ' '.join(reasoning_lines[1:4])
-                
-                # Clean up markdown formatting
-                begründung_text = begründung_text.replace('**Begründung:**', '').replace('**', '').strip()
-                
-                # Extract failed criteria details for binary gates
-                failed_aspects = []
-                if criteria and isinstance(criteria, dict):
-                    for aspect_key, aspect_data in criteria.items():
-                        if isinstance(aspect_data, dict) and not aspect_data.get('passed', True):
-                            aspect_reason = aspect_data.get('reasoning', '')
-                            if aspect_reason:
-                                failed_aspects.append(aspect_reason)
-                
-                # Extract legal violations from scale_info
-                legal_violations = scale_info.get('legal_violations', []) if scale_info else []
-                
-                # Build structured details
-                gate_details = {
-                    "name": gate_name,
-                    "label": label,
-                    "reasoning": begründung_text[:300] if begründung_text else "Keine Begründung verfügbar",
-                    "failed_aspects": failed_aspects[:3],  # Max 3 failed aspects
-                    "legal_violations": legal_violations,
-                    "type": scale_info.get("type", "unknown")
-                }
-                failed_gates_details.append(gate_details)
-        
-        reasoning_parts = []
-        
-        # Summary
-        if failed_count > 0:
-            reasoning_parts.append(f"**Ergebnis:** {failed_count} von {len(dependency_results)} Prüfungen nicht bestanden")
-            reasoning_parts.append(f"\n**Kritische Verstöße:**\n")
-            
-            # List each failed gate with detailed reasoning
-            for gate in failed_gates_details:
-                reasoning_parts.append(f"❌ **{gate['name']}** ({gate['label']})")
-                reasoning_parts.append(f"   {gate['reasoning']}")
-                
-                # Add legal violations if available (for binary gates)
-                if gate.get('legal_violations'):
-                    for violation in gate['legal_violations']:
-                        reasoning_parts.append(f"\n   **Verstoß:** {violation.get('rule_id')} - {violation.get('description')}")
-                        if violation.get('legal_basis'):
-                            reasoning_parts.append(f"   **Rechtsgrundlage:** {violation.get('legal_basis')}")
-                        if violation.get('action'):
-                            reasoning_parts.append(f"   **Maßnahme:** {violation.get('action')}")
-                
-                # Add failed aspects if available (for binary gates without legal violations)
-                elif gate.get('failed_aspects'):
+                # Fallback: everything after the first line
+                _, _, begründung_text = reasoning.strip().partition('\n')
+            begründung_text = ' '.join(
+                _MD_BOLD_RE.sub('', begründung_text).split()
+            )
+
+            reasoning_parts.append(f"❌ **{gate_name}** ({label})")
+            reasoning_parts.append(
+                f"   {begründung_text[:300] if begründung_text else 'Keine Begründung verfügbar'}"
+            )
+
+            # Add legal violations if available (for binary gates)
+            legal_violations = scale_info.get('legal_violations') if scale_info else None
+            if legal_violations:
+                for violation in legal_violations:
+                    reasoning_parts.append(f"\n   **Verstoß:** {violation.get('rule_id')} - {violation.get('description')}")
+                    if violation.get('legal_basis'):
+                        reasoning_parts.append(f"   **Rechtsgrundlage:** {violation.get('legal_basis')}")
+                    if violation.get('action'):
+                        reasoning_parts.append(f"   **Maßnahme:** {violation.get('action')}")
+            elif criteria and isinstance(criteria, dict):
+                # Failed aspects only matter when there are no legal
+                # violations, so they are collected lazily here
+                failed_aspects = [
+                    aspect_data['reasoning']
+                    for aspect_data in criteria.values()
+                    if isinstance(aspect_data, dict)
+                    and not aspect_data.get('passed', True)
+                    and aspect_data.get('reasoning')
+                ][:3]
+                if failed_aspects:
                     reasoning_parts.append(f"\n   **Fehlgeschlagene Aspekte:**")
-                    for aspect in gate['failed_aspects']:
+                    for aspect in failed_aspects:
                         reasoning_parts.append(f"   • {aspect}")
-                
-                reasoning_parts.append("")  # Empty line between gates
-            
-            reasoning_parts.append(f"**Fazit:** {rule.get('reasoning', 'Compliance nicht erfüllt')}")
-        else:
-            reasoning_parts.append(f"**Ergebnis:** Alle {len(dependency_results)} rechtlichen Prüfungen bestanden")
-            reasoning_parts.append(f"\n**Fazit:** {rule.get('reasoning', 'Volle Compliance erreicht')}")
-        
-        return "\n".join(reasoning_parts)
+
+            reasoning_parts.append("")  # Empty line between gates
+
+        if failed_count > 0:
+            return "\n".join([
+                f"**Ergebnis:** {failed_count} von {len(dependency_results)} Prüfungen nicht bestanden",
+                f"\n**Kritische Verstöße:**\n",
+                *reasoning_parts,
+                f"**Fazit:** {rule.get('reasoning', 'Compliance nicht erfüllt')}",
+            ])
+
+        return "\n".join([
+            f"**Ergebnis:** Alle {len(dependency_results)} rechtlichen Prüfungen bestanden",
+            f"\n**Fazit:** {rule.get('reasoning', 'Volle Compliance erreicht')}",
+        ])
     
     def _build_gate_prompt(self, text: str, scheme: Dict[str, Any], context_type: str = "content") -> str:
         """Build prompt for binary gate evaluation.
-        
+
         Args:
             text: Text to evaluate
             scheme: Schema definition
@@ -945,6 +1356,20 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
                          "platform": Evaluate all rules including platform/metadata requirements
                          "both": Evaluate all rules
         """
+        # Everything except the text is static per (scheme, context_type),
+        # so the rule formatting runs once and is cached
+        key = (scheme['id'], context_type)
+        parts = self._gate_prompt_parts.get(key)
+        if parts is None:
+            parts = self._compile_gate_prompt(scheme, context_type)
+            self._gate_prompt_parts[key] = parts
+        prefix, suffix = parts
+        return f"{prefix}{text}{suffix}"
+
+    def _compile_gate_prompt(
+        self, scheme: Dict[str, Any], context_type: str
+    ) -> Tuple[str, str]:
+        """Format the static prefix/suffix of a gate prompt for one context."""
         # Extract and filter gate rules based on scope
         all_gate_rules = scheme.get('gate_rules', [])
         gate_rules = []
@@ -981,13 +1406,14 @@ Erstellen Sie eine zusammenhängende, ausführliche Bewertung (2-3 Sätze), die
             
             rules_text += f"{context_note}\n**Bewertungslogik:** Antworten Sie mit NEIN, wenn der Text KEINEN Verstoß enthält (Gate bestanden). Antworten Sie mit JA, wenn ein Verstoß vorliegt (Gate nicht bestanden)."
         
-        return f"""
+        prefix = f"""
 Sie sind ein Experte für {scheme.get('dimension', 'Content Compliance')}.
 
 **Aufgabe:** {scheme['description']}
 
 **Zu prüfender Text:**
-{text}
+"""
+        suffix = f"""
 
 **Prüfkriterien:**
 {scheme.get('criteria', 'Prüfen Sie, ob der Inhalt die Gate-Anforderungen erfüllt')}
@@ -1005,16 +1431,26 @@ RESULT: NEIN
 REASONING: Der Text beschreibt eine brutale Kampfszene mit expliziter Gewaltdarstellung, die für die Zielgruppe ungeeignet ist.
 {f"ASPEKT_1: JA - Die dargestellte Gewalt überschreitet die Altersfreigabe-Grenzen gemäß JuSchG §14." if gate_rules else ""}
 """
-    
+        return prefix, suffix
+
     def _build_rubric_prompt(self, text: str, scheme: Dict[str, Any]) -> str:
         """Build prompt for ordinal rubric evaluation."""
+        parts = self._rubric_prompt_parts.get(scheme['id'])
+        if parts is None:
+            parts = self._compile_rubric_prompt(scheme)
+            self._rubric_prompt_parts[scheme['id']] = parts
+        prefix, suffix = parts
+        return f"{prefix}{text}{suffix}"
+
+    def _compile_rubric_prompt(self, scheme: Dict[str, Any]) -> Tuple[str, str]:
+        """Format the static prefix/suffix of a rubric prompt."""
         anchors = scheme.get('anchors', [])
         anchors_text = "\n".join([
             f"**Level {anchor['value']}:** {anchor['label']}\n  Beschreibung: {anchor['description']}"
             for anchor in anchors
         ])
         
-        return f"""
+        prefix = f"""
 Sie sind ein Experte für {scheme.get('dimension', 'Content Evaluation')}.
 
 **Aufgabe:** Bewerten Sie den Text anhand der folgenden Rubrik:
@@ -1022,7 +1458,8 @@ Sie sind ein Experte für {scheme.get('dimension', 'Content Evaluation')}.
 {anchors_text}
 
 **Zu bewertender Text:**
-{text}
+"""
+        suffix = """
 
 **Anweisungen:**
 1. Lesen Sie den Text sorgfältig
@@ -1040,9 +1477,19 @@ SCORE: 2
 LABEL: Ausreichend
 REASONING: Der Text zeigt einige relevante Aspekte, jedoch fehlt es an Detailtiefe und vollständiger Argumentation.
 """
-    
+        return prefix, suffix
+
     def _build_checklist_prompt(self, text: str, scheme: Dict[str, Any]) -> str:
         """Build prompt for checklist evaluation."""
+        parts = self._checklist_prompt_parts.get(scheme['id'])
+        if parts is None:
+            parts = self._compile_checklist_prompt(scheme)
+            self._checklist_prompt_parts[scheme['id']] = parts
+        prefix, suffix = parts
+        return f"{prefix}{text}{suffix}"
+
+    def _compile_checklist_prompt(self, scheme: Dict[str, Any]) -> Tuple[str, str]:
+        """Format the static prefix/suffix of a checklist prompt."""
         items_text = []
         for i, item in enumerate(scheme.get('items', []), 1):
             item_text = f"\n**Kriterium {i}: {item['id']}** (Gewicht: {item['weight']})\n"
@@ -1065,7 +1512,7 @@ REASONING: Der Text zeigt einige relevante Aspekte, jedoch fehlt es an Detailtie
                         item_text += f"  Level {level}: {value_data} Punkte\n"
             items_text.append(item_text)
         
-        return f"""
+        prefix = f"""
 Sie sind ein Experte für {scheme.get('dimension', 'Content Evaluation')}.
 
 **Aufgabe:** Bewerten Sie den Text systematisch anhand der folgenden Kriterien:
@@ -1073,7 +1520,8 @@ Sie sind ein Experte für {scheme.get('dimension', 'Content Evaluation')}.
 {''.join(items_text)}
 
 **Zu bewertender Text:**
-{text}
+"""
+        suffix = """
 
 **Anweisungen:**
 1. Bewerten Sie jedes Kriterium einzeln
@@ -1089,18 +1537,96 @@ neutrale_beschreibung: 2 - Weitgehend neutral, jedoch mit vereinzelten wertenden
 
 **Abschließend:** Geben Sie eine Zusammenfassung der Gesamtbewertung in 2-3 Sätzen.
 """
+        return prefix, suffix
     
+    def _checklist_item_index(self, scheme: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Return the cached per-item scoring index for a checklist scheme.
+
+        Flattens each item's `values` into a plain level->score map (folding
+        the old float format and the new {score, description} dict format)
+        and records the level bounds and na score, so the scoring loop never
+        re-derives them per response.
+        """
+        index = self._checklist_index.get(scheme['id'])
+        if index is None:
+            index = {}
+            for item in scheme.get('items', []):
+                values = item.get('values', {})
+                level_to_score = {
+                    level: (value_data['score']
+                            if isinstance(value_data, dict) and 'score' in value_data
+                            else value_data)
+                    for level, value_data in values.items()
+                    if isinstance(level, int)
+                }
+                item_id = item.get('id', '')
+                index[item_id] = {
+                    "level_to_score": level_to_score,
+                    "min_level": min(level_to_score) if level_to_score else None,
+                    "max_level": max(level_to_score) if level_to_score else None,
+                    "na_score": values.get('na', 0.5),
+                    # Defaults resolved once here so the scoring loop reads
+                    # plain keys instead of .get() with fallback objects
+                    "weight": item.get('weight', 1.0),
+                    "name": item.get('prompt', item_id),
+                }
+            self._checklist_index[scheme['id']] = index
+        return index
+
+    def _rubric_anchor_info(self, scheme: Dict[str, Any]) -> Tuple[Dict[Any, str], List[str]]:
+        """Return the cached (label-by-value, levels) pair for a rubric scheme.
+
+        Anchors are static after load, so the dict lookup and the formatted
+        levels list are built once per scheme instead of per evaluation.
+        """
+        info = self._anchor_info.get(scheme['id'])
+        if info is None:
+            anchors = scheme.get('anchors', [])
+            info = (
+                {anchor['value']: anchor['label'] for anchor in anchors},
+                [f"{anchor['value']}: {anchor['label']}" for anchor in anchors],
+            )
+            self._anchor_info[scheme['id']] = info
+        return info
+
+    def _gate_rule_keys(self, scheme: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Return the cached (criteria key, response tag, rule) gate triples.
+
+        The aspekt_i / ASPEKT_i key strings are static per scheme, so they
+        are formatted once here instead of per response in both the
+        breakdown and the legal-violations walks.
+        """
+        prepared = self._gate_rules_prepared.get(scheme['id'])
+        if prepared is None:
+            prepared = [
+                (f"aspekt_{i}", f"ASPEKT_{i}", rule)
+                for i, rule in enumerate(scheme.get('gate_rules', []), 1)
+            ]
+            self._gate_rules_prepared[scheme['id']] = prepared
+        return prepared
+
     def _match_first_anchor(self, content: str, scheme: Dict[str, Any]) -> Dict[str, Any]:
         """Match content to first applicable anchor."""
-        # Simple keyword matching - could be enhanced with LLM parsing
-        for anchor in scheme.get('anchors', []):
-            if str(anchor['value']) in content or anchor['label'].lower() in content.lower():
+        # Simple keyword matching - could be enhanced with LLM parsing.
+        # Value strings and lowered labels are precomputed per scheme, and
+        # the content is lowered once instead of per anchor.
+        prepared = self._anchors_prepared.get(scheme['id'])
+        if prepared is None:
+            prepared = [
+                (str(anchor['value']), anchor['label'].lower(), anchor)
+                for anchor in scheme.get('anchors', [])
+            ]
+            self._anchors_prepared[scheme['id']] = prepared
+
+        content_lower = content.lower()
+        for value_str, label_lower, anchor in prepared:
+            if value_str in content or label_lower in content_lower:
                 return {
                     "value": anchor['value'],
                     "label": anchor['label'],
                     "confidence": 0.8
                 }
-        
+
         return {"value": None, "na_reason": "No matching anchor found"}
     
     def _match_best_anchor(self, content: str, scheme: Dict[str, Any]) -> Dict[str, Any]:
@@ -1115,140 +1641,126 @@ neutrale_beschreibung: 2 - Weitgehend neutral, jedoch mit vereinzelten wertenden
     ) -> tuple[float, Dict[str, Any]]:
         """Calculate weighted score from checklist responses."""
         items = scheme.get('items', [])
+        # Bound once; read repeatedly inside the per-item loop below
+        aggregator_params = scheme.get('aggregator', {}).get('params', {})
+        scale_factor = aggregator_params.get('scale_factor', 1.0)
+        missing_strategy = aggregator_params.get('missing', 'ignore')
         total_weight = 0
         weighted_score = 0
         criterion_results = {}
         
-        # Parse structured responses using the new format
-        content_lines = content.split('\n')
-        
+        # Parse structured responses using the new format. splitlines()
+        # runs on the C fast path and also copes with \r\n from some models;
+        # the list is kept because the contextual fallback below needs
+        # indexed access for its 3-line window.
+        content_lines = content.splitlines()
+
+        # Index the response once: "item_id: LEVEL - reasoning" lines keyed
+        # by lowercased item id (first occurrence wins), so each item below
+        # is an O(1) lookup instead of a scan over every line
+        parsed_lines: Dict[str, Tuple[str, Optional[str]]] = {}
+        for line in content_lines:
+            idx = line.find(':')
+            if idx <= 0:
+                continue
+            line_key = line[:idx].strip().lower()
+            parts = line[idx + 1:].strip()
+            response_part, _, line_reasoning = parts.partition(' - ')
+            parsed_lines.setdefault(
+                line_key, (response_part.strip(), line_reasoning if line_reasoning else None)
+            )
+
+        item_index = self._checklist_item_index(scheme)
+
+        # Lowercased lines for the contextual fallback search, built lazily
+        # since well-formed responses never need them
+        content_lines_lower: Optional[List[str]] = None
+
         for item in items:
-            weight = item.get('weight', 1.0)
-            values = item.get('values', {})
             item_id = item.get('id', '')
-            
+            item_info = item_index[item_id]
+            weight = item_info["weight"]
+            level_to_score = item_info["level_to_score"]
+
             # Look for structured format: "item_id: [LEVEL_NUMBER] - reasoning"
             item_score = None
             item_response = "UNCLEAR"
             reasoning = "No evaluation found"
-            
-            for line in content_lines:
-                if line.strip().startswith(f"{item_id}:"):
-                    # Parse structured line
-                    parts = line.split(':', 1)[1].strip()
-                    if ' - ' in parts:
-                        response_part, reasoning = parts.split(' - ', 1)
-                        response_part = response_part.strip()
+
+            hit = parsed_lines.get(item_id.lower())
+            if hit is not None:
+                response_part, line_reasoning = hit
+                if line_reasoning is not None:
+                    reasoning = line_reasoning
+
+                # Parse numeric level against the precomputed score map
+                try:
+                    level = int(response_part)
+                    if level in level_to_score:
+                        item_response = str(level)
+                        item_score = level_to_score[level]
+                    elif level_to_score:
+                        # Fallback to closest valid level
+                        closest_level = min(level_to_score, key=lambda x: abs(x - level))
+                        item_response = str(closest_level)
+                        item_score = level_to_score[closest_level]
+                except ValueError:
+                    # Handle non-numeric responses as fallback: JA-like
+                    # answers map to the highest level, NEIN-like to the
+                    # lowest, anything else counts as unclear
+                    direction = _YES_NO_MAP.get(response_part.upper())
+                    if direction == 'max':
+                        if item_info["max_level"] is not None:
+                            item_response = str(item_info["max_level"])
+                            item_score = level_to_score[item_info["max_level"]]
+                    elif direction == 'min':
+                        if item_info["min_level"] is not None:
+                            item_response = str(item_info["min_level"])
+                            item_score = level_to_score[item_info["min_level"]]
                     else:
-                        response_part = parts.strip()
-                    
-                    # Parse numeric level from YAML values
-                    try:
-                        level = int(response_part)
-                        if level in values:
-                            item_response = str(level)
-                            # Handle both old format (float) and new format (dict with score)
-                            value_data = values[level]
-                            if isinstance(value_data, dict) and 'score' in value_data:
-                                item_score = value_data['score']
-                            else:
-                                item_score = value_data
-                        else:
-                            # Fallback to closest valid level
-                            valid_levels = [k for k in values.keys() if isinstance(k, int)]
-                            if valid_levels:
-                                closest_level = min(valid_levels, key=lambda x: abs(int(x) - level))
-                                item_response = str(closest_level)
-                                # Handle both old format (float) and new format (dict with score)
-                                value_data = values[closest_level]
-                                if isinstance(value_data, dict) and 'score' in value_data:
-                                    item_score = value_data['score']
-                                else:
-                                    item_score = value_data
-                    except ValueError:
-                        # Handle non-numeric responses as fallback
-                        response_upper = response_part.upper()
-                        if response_upper in ['JA', 'YES', 'TRUE']:
-                            # Map to highest level
-                            int_keys = [k for k in values.keys() if isinstance(k, int)]
-                            if int_keys:
-                                max_level = max(int_keys)
-                                item_response = str(max_level)
-                                # Handle both old format (float) and new format (dict with score)
-                                value_data = values[max_level]
-                                if isinstance(value_data, dict) and 'score' in value_data:
-                                    item_score = value_data['score']
-                                else:
-                                    item_score = value_data
-                        elif response_upper in ['NEIN', 'NO', 'FALSE']:
-                            # Map to lowest level
-                            int_keys = [k for k in values.keys() if isinstance(k, int)]
-                            if int_keys:
-                                min_level = min(int_keys)
-                                item_response = str(min_level)
-                                # Handle both old format (float) and new format (dict with score)
-                                value_data = values[min_level]
-                                if isinstance(value_data, dict) and 'score' in value_data:
-                                    item_score = value_data['score']
-                                else:
-                                    item_score = value_data
-                        else:
-                            item_response = "UNCLEAR"
-                            item_score = values.get('na', 0.5)
-                    break
-            
+                        item_response = "UNCLEAR"
+                        item_score = item_info["na_score"]
+
             # Fallback parsing if structured format not found
             if item_score is None:
+                if content_lines_lower is None:
+                    content_lines_lower = [line.lower() for line in content_lines]
+                item_id_lower = item_id.lower()
                 item_section = ""
-                for i, line in enumerate(content_lines):
-                    if item_id in line.lower():
+                for i, line_lower in enumerate(content_lines_lower):
+                    if item_id_lower in line_lower:
                         item_section = '\n'.join(content_lines[i:i+3])
                         break
-                
+
                 if item_section:
-                    # Try to extract numeric levels from context
-                    import re
-                    level_matches = re.findall(r'\b([1-4])\b', item_section)
-                    
-                    if level_matches:
-                        # Use first found level
-                        level = int(level_matches[0])
-                        if level in values:
-                            # Handle both old format (float) and new format (dict with score)
-                            value_data = values[level]
-                            if isinstance(value_data, dict) and 'score' in value_data:
-                                item_score = value_data['score']
-                            else:
-                                item_score = value_data
+                    # Try to extract a numeric level from context; only the
+                    # first hit is used, so search() stops there instead of
+                    # collecting every match
+                    level_match = _LEVEL_RE.search(item_section)
+
+                    if level_match:
+                        level = int(level_match.group(1))
+                        if level in level_to_score:
+                            item_score = level_to_score[level]
                             item_response = str(level)
                             reasoning = "Inferred from context"
                     else:
-                        # Fallback to sentiment analysis
-                        yes_count = item_section.lower().count('yes') + item_section.lower().count('ja')
-                        no_count = item_section.lower().count('no') + item_section.lower().count('nein')
-                        
+                        # Fallback to sentiment analysis: one word-bounded
+                        # scan instead of four substring counts
+                        tokens = _YESNO_RE.findall(item_section.lower())
+                        yes_count = tokens.count('yes') + tokens.count('ja')
+                        no_count = tokens.count('no') + tokens.count('nein')
+
                         if no_count > yes_count and no_count > 0:
-                            int_keys = [k for k in values.keys() if isinstance(k, int)]
-                            if int_keys:
-                                min_level = min(int_keys)
-                                # Handle both old format (float) and new format (dict with score)
-                                value_data = values[min_level]
-                                if isinstance(value_data, dict) and 'score' in value_data:
-                                    item_score = value_data['score']
-                                else:
-                                    item_score = value_data
+                            if item_info["min_level"] is not None:
+                                min_level = item_info["min_level"]
+                                item_score = level_to_score[min_level]
                                 item_response = str(min_level)
                                 reasoning = "Inferred from context (negative)"
                         elif yes_count > no_count and yes_count > 0:
-                            int_keys = [k for k in values.keys() if isinstance(k, int)]
-                            if int_keys:
-                                max_level = max(int_keys)
-                                # Handle both old format (float) and new format (dict with score)
-                                value_data = values[max_level]
-                                if isinstance(value_data, dict) and 'score' in value_data:
-                                    item_score = value_data['score']
-                                else:
-                                    item_score = value_data
+                            if item_info["max_level"] is not None:
+                                max_level = item_info["max_level"]
+                                item_score = level_to_score[max_level]
                                 item_response = str(max_level)
                                 reasoning = "Inferred from context (positive)"
             
@@ -1258,11 +1770,10 @@ neutrale_beschreibung: 2 - Weitgehend neutral, jedoch mit vereinzelten wertenden
                 total_weight += weight
                 
                 # Normalize individual score to output scale for user understanding
-                scale_factor = scheme.get('aggregator', {}).get('params', {}).get('scale_factor', 1.0)
                 normalized_score = item_score * scale_factor
                 
                 criterion_results[item_id] = {
-                    "name": item.get('prompt', item_id),
+                    "name": item_info["name"],
                     "response": item_response,
                     "normalized_score": round(normalized_score, 2),
                     "weight": weight,
@@ -1270,55 +1781,69 @@ neutrale_beschreibung: 2 - Weitgehend neutral, jedoch mit vereinzelten wertenden
                 }
             else:
                 # Handle missing evaluation
-                missing_strategy = scheme.get('aggregator', {}).get('params', {}).get('missing', 'ignore')
                 if missing_strategy != 'ignore':
                     total_weight += weight
                 
                 criterion_results[item_id] = {
-                    "name": item.get('prompt', item_id),
+                    "name": item_info["name"],
                     "response": "UNCLEAR",
                     "normalized_score": None,
                     "weight": weight,
                     "reasoning": "No evaluation found"
                 }
         
-        # Calculate weighted average score across all items
-        items = scheme.get('items', [])
-        total_weighted_score = 0
-        total_weight = 0
-        
+        # Calculate weighted average score across all items. The score and
+        # weight columns are gathered once, then reduced with math.sumprod /
+        # math.fsum (C-level loops, no intermediate list of products).
+        scores: List[float] = []
+        weights: List[float] = []
+
         for item in items:
             item_id = item['id']
             if item_id in criterion_results:
                 score = criterion_results[item_id]['normalized_score']
-                weight = item.get('weight', 1.0)
-                total_weighted_score += score * weight
-                total_weight += weight
-        
-        average_score = total_weighted_score / total_weight if total_weight > 0 else 0
-        scale_factor = scheme.get('aggregator', {}).get('params', {}).get('scale_factor', 1.0)
-        final_score = average_score
-        
-        return final_score, criterion_results
+                # Unscored items (UNCLEAR / na: null) carry no normalized score
+                if score is None:
+                    continue
+                scores.append(score)
+                weights.append(item_index[item_id]["weight"])
+
+        total_weight = math.fsum(weights)
+        average_score = math.sumprod(scores, weights) / total_weight if total_weight > 0 else 0
+
+        return average_score, criterion_results
     
     def _score_to_label(self, score: float, scheme: Dict[str, Any]) -> str:
         """Convert numeric score to label using German labels from YAML."""
         labels = scheme.get('labels', {})
         if not labels:
             return "Unknown"
-        
-        # Sort thresholds in descending order and find first match
+
+        # Thresholds are static per scheme: parse and sort them once
+        # (ascending, as parallel tuples) instead of per scored result
+        prepared = self._labels_sorted.get(scheme['id'])
+        if prepared is None:
+            try:
+                pairs = sorted((float(threshold), label) for threshold, label in labels.items())
+                prepared = (
+                    tuple(threshold for threshold, _ in pairs),
+                    tuple(label for _, label in pairs),
+                )
+            except (ValueError, TypeError):
+                prepared = ((), ())
+            self._labels_sorted[scheme['id']] = prepared
+
+        thresholds, sorted_labels = prepared
+        if not thresholds:
+            return "Unknown"
+
         try:
-            for threshold_str, label in sorted(labels.items(), key=lambda x: float(x[0]), reverse=True):
-                threshold = float(threshold_str)
-                if score >= threshold:
-                    return label
-            
-            # Fallback to lowest label if score is below all thresholds
-            lowest_threshold = min(labels.keys(), key=lambda x: float(x))
-            return labels[lowest_threshold]
-        except (ValueError, TypeError) as e:
-            # Handle any conversion errors
+            # Binary search for the highest threshold <= score; below all
+            # thresholds, fall back to the lowest label
+            index = bisect.bisect_right(thresholds, score)
+            return sorted_labels[index - 1] if index > 0 else sorted_labels[0]
+        except TypeError:
+            # Handle any comparison errors (e.g. score is None)
             return "Unknown"
     
     def _check_rule_conditions(
@@ -1327,61 +1852,57 @@ neutrale_beschreibung: 2 - Weitgehend neutral, jedoch mit vereinzelten wertenden
         conditions: List[Dict[str, Any]]
     ) -> bool:
         """Check if derivation rule conditions are met."""
+        # Index results by dimension once (first occurrence wins); each
+        # condition below is then an O(1) lookup instead of a list scan
+        by_dimension: Dict[Any, Dict[str, Any]] = {}
+        for result in results:
+            by_dimension.setdefault(result.get('dimension'), result)
+
         for condition in conditions:
-            dimension = condition.get('dimension')
-            operator = condition.get('operator', '>=')
-            threshold = condition.get('value')
-            
-            result = next((r for r in results if r.get('dimension') == dimension), None)
+            result = by_dimension.get(condition.get('dimension'))
             if not result or result.get('value') is None:
                 return False
-            
-            value = result['value']
-            if operator == '>=' and value >= threshold:
-                continue
-            elif operator == '>' and value > threshold:
-                continue
-            elif operator == '<=' and value <= threshold:
-                continue
-            elif operator == '<' and value < threshold:
-                continue
-            elif operator == '==' and value == threshold:
-                continue
-            else:
+
+            compare = _CONDITION_OPS.get(condition.get('operator', '>='))
+            if compare is None or not compare(result['value'], condition.get('value')):
                 return False
-        
+
         return True
     
     def _calculate_overall(self, results: List[Dict[str, Any]]) -> tuple[Optional[float], Optional[str]]:
         """Calculate overall score and label from non-binary evaluation results."""
-        valid_results: List[tuple[Dict[str, Any], Dict[str, Any]]] = []
+        # Single accumulation pass; no intermediate list of (result, scheme)
+        # pairs is materialized. Bound methods are hoisted out of the loop
+        # so each iteration skips the attribute walks on self.
+        schemes_get = self.schemes.get
+        scale_types_get = self._scale_types.get
+        total = 0.0
+        count = 0
+        reference_scheme: Optional[Dict[str, Any]] = None
         for result in results:
             value = result.get('value')
             if value is None or not isinstance(value, (int, float)):
                 continue
 
-            scheme = self.schemes.get(result.get('scheme_id'))
+            scheme_id = result.get('scheme_id')
+            scheme = schemes_get(scheme_id)
             if not scheme:
                 continue
 
-            try:
-                scheme_type = ScaleType(scheme['type'])
-            except (KeyError, ValueError):
-                continue
-
-            if scheme_type is ScaleType.BINARY_GATE:
+            if scale_types_get(scheme_id) is ScaleType.BINARY_GATE:
                 # Binary gate outcomes are not averaged into overall scores
                 continue
 
-            valid_results.append((result, scheme))
+            total += value
+            count += 1
+            if reference_scheme is None:
+                # Use label from first scheme's YAML labels
+                reference_scheme = scheme
 
-        if not valid_results:
+        if count == 0:
             return None, None
 
-        overall_score = sum(result['value'] for result, _ in valid_results) / len(valid_results)
-
-        # Use label from first scheme's YAML labels
-        _, reference_scheme = valid_results[0]
+        overall_score = total / count
         overall_label = self._score_to_label(overall_score, reference_scheme)
 
         return overall_score, overall_label
@@ -1,8 +1,11 @@
 """LLM Content Evaluator - AI-powered content evaluation using LLM as Judge methodology."""
 
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from api.routes import health, schemes, evaluate
@@ -21,7 +24,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown: Cleanup resources
     logger.info("🔄 Shutting down EvaluationEngine...")
-    shutdown_engine()
+    await shutdown_engine()
     logger.info("✅ Shutdown complete")
 
 
@@ -29,16 +32,30 @@ app = FastAPI(
     title="LLM Content Evaluator",
     description="AI-powered content evaluation API using LLM as Judge methodology for educational content quality assessment and legal compliance",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson is considerably faster than stdlib json for the nested
+    # results/criteria payloads returned by /evaluate
+    default_response_class=ORJSONResponse
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS is opt-in via CORS_ORIGINS (comma-separated list). The previous
+# allow_origins=["*"] + allow_credentials=True combination is rejected by
+# browsers anyway, and the middleware inspects headers on every request —
+# pure overhead for internal service-to-service traffic. With an explicit
+# origin list, allow_credentials becomes meaningful.
+_cors_origins = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()]
+if _cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=_cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+# Responses with reasoning/criteria run to multiple KB of JSON; gzip cuts
+# the wire size substantially while small payloads skip compression
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 app.include_router(health.router)
 app.include_router(schemes.router)
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ScaleType(str, Enum):
@@ -66,14 +66,14 @@ class EvaluationRequest(BaseModel):
         description="Text content to be evaluated (educational material, articles, etc.)",
         min_length=10,
         max_length=50000,
-        example="Die deutsche Geschichte zwischen 1918 und 1945 war geprägt von politischen Umbrüchen..."
+        json_schema_extra={"example": "Die deutsche Geschichte zwischen 1918 und 1945 war geprägt von politischen Umbrüchen..."}
     )
     schemes: List[str] = Field(
         ...,
         description="List of evaluation scheme IDs to apply. Available schemes include quality dimensions (neutralitaet_new, sachrichtigkeit_old, etc.), legal gates (jugendschutz_gate, strafrecht_gate), and derived evaluations (rechtliche_compliance, overall_quality)",
-        min_items=1,
-        max_items=10,
-        example=["neutralitaet_new", "sachrichtigkeit_old"]
+        min_length=1,
+        max_length=10,
+        json_schema_extra={"example": ["neutralitaet_new", "sachrichtigkeit_old"]}
     )
     include_reasoning: bool = Field(
         True,
@@ -82,7 +82,7 @@ class EvaluationRequest(BaseModel):
     context_type: str = Field(
         "content",
         description="Evaluation context: 'content' (default, UGC/general content - only content rules), 'platform' (commercial platforms - all rules including metadata), or 'both' (full evaluation)",
-        example="content"
+        json_schema_extra={"example": "content"}
     )
 
 
@@ -95,22 +95,22 @@ class SchemeInfo(BaseModel):
     id: str = Field(
         ..., 
         description="Unique scheme identifier used in evaluation requests",
-        example="neutralitaet_new"
+        json_schema_extra={"example": "neutralitaet_new"}
     )
     name: str = Field(
         ..., 
         description="Human-readable scheme name for display purposes",
-        example="Neutralität (Neue Bewertung)"
+        json_schema_extra={"example": "Neutralität (Neue Bewertung)"}
     )
     description: str = Field(
         ..., 
         description="Detailed description of what this scheme evaluates",
-        example="Bewertung der politischen und weltanschaulichen Neutralität von Bildungsinhalten"
+        json_schema_extra={"example": "Bewertung der politischen und weltanschaulichen Neutralität von Bildungsinhalten"}
     )
     dimension: str = Field(
         ..., 
         description="Quality dimension or compliance area being assessed",
-        example="neutrality"
+        json_schema_extra={"example": "neutrality"}
     )
     scale_type: ScaleType = Field(
         ..., 
@@ -119,12 +119,12 @@ class SchemeInfo(BaseModel):
     output_range: Dict[str, Union[int, float, str, bool, List[Union[int, float, str, bool]]]] = Field(
         ..., 
         description="Possible output values and ranges for this scheme",
-        example={"min": 0.0, "max": 5.0, "type": "float"}
+        json_schema_extra={"example": {"min": 0.0, "max": 5.0, "type": "float"}}
     )
     version: str = Field(
         ..., 
         description="Scheme version for tracking updates and compatibility",
-        example="2.0"
+        json_schema_extra={"example": "2.0"}
     )
 
 
@@ -134,6 +134,8 @@ class SchemesResponse(BaseModel):
     Provides comprehensive information about loaded schemes
     to help users select appropriate evaluations.
     """
+    model_config = ConfigDict(frozen=True)
+
     schemes: List[SchemeInfo] = Field(
         ..., 
         description="List of all available evaluation schemes with detailed metadata"
@@ -141,12 +143,12 @@ class SchemesResponse(BaseModel):
     total: int = Field(
         ..., 
         description="Total number of schemes available",
-        example=15
+        json_schema_extra={"example": 15}
     )
     status: str = Field(
         default="success", 
         description="Response status indicator",
-        example="success"
+        json_schema_extra={"example": "success"}
     )
 
 
@@ -155,23 +157,29 @@ class EvaluationResult(BaseModel):
     
     Contains the evaluation outcome, score, label, and detailed breakdown
     of how the result was calculated including individual criteria.
+
+    Instances are built in tight per-scheme loops, so the model is frozen:
+    immutable instances are cheaper to hold and safe to share (e.g. from
+    the engine's result cache).
     """
-    scheme_id: str = Field(..., description="ID of the evaluation scheme used", example="neutralitaet_new")
-    dimension: str = Field(..., description="Quality dimension being evaluated", example="neutrality")
+    model_config = ConfigDict(frozen=True)
+
+    scheme_id: str = Field(..., description="ID of the evaluation scheme used", json_schema_extra={"example": "neutralitaet_new"})
+    dimension: str = Field(..., description="Quality dimension being evaluated", json_schema_extra={"example": "neutrality"})
     value: Optional[Union[int, float, str]] = Field(
         None, 
         description="Numeric score or result value. For quality scales: 0.0-5.0, for binary gates: 0 or 1",
-        example=2.35
+        json_schema_extra={"example": 2.35}
     )
     label: Optional[str] = Field(
         None, 
         description="Human-readable label corresponding to the score",
-        example="Ideologisch eingefärbt, aber korrekter Inhalt"
+        json_schema_extra={"example": "Ideologisch eingefärbt, aber korrekter Inhalt"}
     )
     confidence: Optional[float] = Field(
         None, 
         description="Confidence level of the evaluation (0.0-1.0)",
-        example=0.8
+        json_schema_extra={"example": 0.8}
     )
     reasoning: Optional[str] = Field(
         None, 
@@ -215,6 +223,8 @@ class EvaluationResponse(BaseModel):
         "provenance": {...}
     }
     """
+    model_config = ConfigDict(frozen=True)
+
     results: List[EvaluationResult] = Field(
         ..., 
         description="List of evaluation results, one for each requested scheme"
@@ -247,18 +257,20 @@ class HealthResponse(BaseModel):
     Used to verify the evaluation service is running properly and
     has successfully loaded all evaluation schemes.
     """
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(
         ..., 
         description="Service health status: 'healthy', 'degraded', or 'unhealthy'",
-        example="healthy"
+        json_schema_extra={"example": "healthy"}
     )
     version: str = Field(
         ..., 
         description="API version number",
-        example="0.1.0"
+        json_schema_extra={"example": "0.1.0"}
     )
     schemes_loaded: int = Field(
         ..., 
         description="Number of evaluation schemes successfully loaded and available",
-        example=15
+        json_schema_extra={"example": 15}
     )
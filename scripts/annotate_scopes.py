@@ -23,7 +23,13 @@ HINWEIS:
 """
 
 import yaml
+try:
+    # libyaml-backed loader/dumper is ~5-10x faster than the pure-Python parser
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
 import os
+import re
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -115,24 +121,34 @@ CONTENT_KEYWORDS = [
 ]
 
 
+# Spezialfall-Phrasen (hohe Priorität) als eine Alternation mit benannten
+# Gruppen: ein Scan entscheidet, ob und welcher Spezialfall greift
+_SPECIAL_RE = re.compile(
+    r"(?P<content>entwicklungsbeeinträchtigend für altersstufe)|"
+    r"(?P<platform>fehlende oder unzutreffende altersfreigabe|"
+    r"keine prüfung durch|fehlende kennzeichnung|fehlende deskriptor)"
+)
+
+
 def classify_rule_scope(rule: Dict[str, Any]) -> str:
     """Klassifiziert eine Rule basierend auf ihrer Beschreibung."""
     description = rule.get('description', '').lower()
-    
-    # Zähle Platform- und Content-Keywords
+
+    # Spezialfälle (hohe Priorität): ein Scan statt fünf Substring-Suchen;
+    # Content-Spezialfälle behalten Vorrang vor Platform-Spezialfällen
+    special = None
+    for match in _SPECIAL_RE.finditer(description):
+        if match.lastgroup == 'content':
+            return 'content'
+        special = 'platform'
+    if special:
+        return special
+
+    # Zähle Platform- und Content-Keywords (C-schnelle Substring-Suchen;
+    # Präfix-Paare wie kein/keine zählen wie zuvor doppelt)
     platform_score = sum(1 for kw in PLATFORM_KEYWORDS if kw in description)
     content_score = sum(1 for kw in CONTENT_KEYWORDS if kw in description)
     
-    # Spezialfälle (hohe Priorität)
-    if 'entwicklungsbeeinträchtigend für altersstufe' in description:
-        return 'content'  # Inhaltliche Bewertung
-    
-    if any(kw in description for kw in ['fehlende oder unzutreffende altersfreigabe', 
-                                          'keine prüfung durch', 
-                                          'fehlende kennzeichnung',
-                                          'fehlende deskriptor']):
-        return 'platform'  # Metadaten-Anforderung
-    
     # Score-basierte Entscheidung
     if platform_score > content_score:
         return 'platform'
@@ -143,90 +159,91 @@ def classify_rule_scope(rule: Dict[str, Any]) -> str:
         return 'both'
 
 
-def annotate_schema_file(filepath: Path) -> bool:
-    """Annotiert eine Schema-Datei mit scope-Attributen."""
+def annotate_schema_file(filepath: Path) -> "bool | None":
+    """Annotiert eine Schema-Datei mit scope-Attributen.
+
+    Rückgabe: True = annotiert, False = Binary Gate aber übersprungen,
+    None = kein Binary Gate (oder Fehler). Die Datei wird dafür nur
+    einmal geparst.
+    """
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        
+            original = f.read()
+        data = yaml.load(original, Loader=_YamlLoader)
+
         # Nur Binary Gates haben gate_rules
-        if data.get('type') != 'binary_gate':
-            return False
-        
+        if not isinstance(data, dict) or data.get('type') != 'binary_gate':
+            return None
+
         gate_rules = data.get('gate_rules', [])
         if not gate_rules:
             return False
-        
+
         # Prüfe ob bereits annotiert
         if any('scope' in rule for rule in gate_rules):
             print(f"  ⏭️  {filepath.name} - bereits annotiert")
             return False
-        
+
         # Annotiere jede Rule
-        changes_made = False
         for rule in gate_rules:
-            scope = classify_rule_scope(rule)
-            rule['scope'] = scope
-            changes_made = True
-        
-        # Schreibe zurück
-        if changes_made:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-            
-            content_count = sum(1 for r in gate_rules if r.get('scope') == 'content')
-            platform_count = sum(1 for r in gate_rules if r.get('scope') == 'platform')
-            both_count = sum(1 for r in gate_rules if r.get('scope') == 'both')
-            
-            print(f"  ✅ {filepath.name}")
-            print(f"     Content: {content_count}, Platform: {platform_count}, Both: {both_count}")
-            return True
-        
-        return False
-        
+            rule['scope'] = classify_rule_scope(rule)
+
+        # Schreibe zurück: erst serialisieren, unveränderte Dateien
+        # überspringen, dann atomar via tmp-Datei + os.replace ersetzen
+        # (ein Abbruch mitten im Schreiben lässt das Schema intakt)
+        dumped = yaml.dump(data, Dumper=_YamlDumper, allow_unicode=True,
+                           default_flow_style=False, sort_keys=False)
+        if dumped == original:
+            print(f"  ⏭️  {filepath.name} - unverändert")
+            return False
+
+        tmp_path = filepath.with_suffix(filepath.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(dumped)
+        os.replace(tmp_path, filepath)
+
+        content_count = sum(1 for r in gate_rules if r.get('scope') == 'content')
+        platform_count = sum(1 for r in gate_rules if r.get('scope') == 'platform')
+        both_count = sum(1 for r in gate_rules if r.get('scope') == 'both')
+
+        print(f"  ✅ {filepath.name}")
+        print(f"     Content: {content_count}, Platform: {platform_count}, Both: {both_count}")
+        return True
+
     except Exception as e:
         print(f"  ❌ {filepath.name} - Fehler: {e}")
-        return False
+        return None
 
 
 def main():
     """Hauptfunktion."""
     schemes_dir = Path(__file__).parent.parent / 'schemes'
-    
+
     if not schemes_dir.exists():
         print(f"❌ Schemes-Verzeichnis nicht gefunden: {schemes_dir}")
         return
-    
+
     print(f"🔍 Suche Binary Gate Schemas in: {schemes_dir}\n")
-    
-    # Finde alle YAML-Dateien
-    yaml_files = list(schemes_dir.glob('*.yaml'))
-    binary_gates = []
-    
-    for filepath in yaml_files:
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            if data.get('type') == 'binary_gate':
-                binary_gates.append(filepath)
-        except:
-            pass
-    
-    print(f"📊 Gefunden: {len(binary_gates)} Binary Gate Schemas\n")
-    
-    if not binary_gates:
-        print("⚠️  Keine Binary Gate Schemas gefunden!")
-        return
-    
-    # Annotiere alle Schemas
     print("🚀 Starte Annotation...\n")
+
+    # Ein Durchlauf: jede YAML-Datei wird genau einmal geparst;
+    # annotate_schema_file erkennt Binary Gates selbst
+    gate_count = 0
     annotated_count = 0
-    
-    for filepath in sorted(binary_gates):
-        if annotate_schema_file(filepath):
+
+    for filepath in sorted(schemes_dir.glob('*.yaml')):
+        result = annotate_schema_file(filepath)
+        if result is None:
+            continue
+        gate_count += 1
+        if result:
             annotated_count += 1
-    
-    print(f"\n✅ Fertig! {annotated_count} von {len(binary_gates)} Schemas annotiert")
+
+    if not gate_count:
+        print("⚠️  Keine Binary Gate Schemas gefunden!")
+        return
+
+    print(f"\n✅ Fertig! {annotated_count} von {gate_count} Schemas annotiert")
 
 
 if __name__ == '__main__':
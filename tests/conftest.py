@@ -0,0 +1,11 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+from pathlib import Path
+
+# Make the application packages importable regardless of invocation dir
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Settings require an API key at import time; tests never call the real API
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
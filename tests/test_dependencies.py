@@ -0,0 +1,25 @@
+"""Regression tests for the singleton wiring in core.dependencies.
+
+The entire request path assumes one shared EvaluationEngine (and with it
+one result cache, one coalescer, one compiled-prompt cache) and one
+pooled OpenAI client per process; these tests pin that behavior down.
+"""
+
+from core import dependencies
+
+
+def test_get_engine_instance_returns_same_object():
+    first = dependencies.get_engine_instance()
+    second = dependencies.get_engine_instance()
+    assert first is second
+
+
+def test_get_openai_client_instance_returns_same_object():
+    first = dependencies.get_openai_client_instance()
+    second = dependencies.get_openai_client_instance()
+    assert first is second
+
+
+def test_schemes_count_matches_engine():
+    engine = dependencies.get_engine_instance()
+    assert dependencies.get_schemes_count() == len(engine.schemes)